@@ -0,0 +1,94 @@
+"""
+Compare memory used by plain dict movie entries against Movie records.
+
+Builds N synthetic movies both ways under tracemalloc, then measures the
+cost of handing the collection out the old way (a dict copy per call)
+against a RankedView.
+
+Usage:
+    python benchmarks/bench_movie_memory.py [--count 10000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from movie import Movie, RankedView  # noqa: E402
+
+
+GENRES = ["Drama", "Crime", "Action", "Adventure", "Comedy", "Thriller", "Sci-Fi", "Romance"]
+DIRECTORS = [f"Director {i}" for i in range(400)]
+
+
+def synthetic_details(i, rng):
+    """Return a details dict shaped like MovieManager.get_movie_details output."""
+    imdb_id = f"tt{i:07d}"
+    # Build the repeated strings at runtime, as the scraper does, so they are
+    # distinct objects unless something interns them
+    return {
+        "rank": i + 1,
+        "title": f"Synthetic Movie {i}",
+        "imdb_id": imdb_id,
+        "url": f"https://www.imdb.com/title/{imdb_id}/",
+        "year": str(1950 + rng.randrange(75)),
+        "director": "".join(rng.choice(DIRECTORS)),
+        "rating": f"{rng.uniform(7, 9.3):.1f}",
+        "genre": ", ".join(rng.sample(GENRES, 2)),
+        "description": "".join(["N/A"]),
+        "storyline": " ".join(f"word{rng.randrange(5000)}" for _ in range(120)),
+        "poster_url": None,
+        "details_fetched": True,
+        "fetched_at": time.time(),
+    }
+
+
+def measure(build):
+    """Return (result, bytes allocated) for building a collection."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=10000)
+    args = parser.parse_args()
+
+    # Build each store from freshly generated details, as a scrape would,
+    # so the strings themselves are counted too
+    rng = random.Random(226)
+    dict_store, dict_bytes = measure(
+        lambda: {d["imdb_id"]: d for d in (synthetic_details(i, rng) for i in range(args.count))})
+    rng = random.Random(226)
+    record_store, record_bytes = measure(
+        lambda: {d["imdb_id"]: Movie.from_dict(d) for d in (synthetic_details(i, rng) for i in range(args.count))})
+
+    ranking = list(record_store)
+    start = time.perf_counter()
+    for _ in range(100):
+        {i + 1: dict_store[imdb_id] for i, imdb_id in enumerate(ranking)}
+    copy_seconds = (time.perf_counter() - start) / 100
+
+    start = time.perf_counter()
+    for _ in range(100):
+        RankedView(record_store, ranking)
+    view_seconds = (time.perf_counter() - start) / 100
+
+    print(f"Movies:                 {args.count}")
+    print(f"dict entries:           {dict_bytes / 1024:,.0f} KiB ({dict_bytes / args.count:,.0f} B/movie)")
+    print(f"Movie records:          {record_bytes / 1024:,.0f} KiB ({record_bytes / args.count:,.0f} B/movie)")
+    print(f"Reduction:              {100 * (1 - record_bytes / dict_bytes):.1f}%")
+    print(f"Ranked dict copy:       {copy_seconds * 1e3:.3f} ms/call")
+    print(f"RankedView:             {view_seconds * 1e6:.3f} us/call")
+
+
+if __name__ == "__main__":
+    main()
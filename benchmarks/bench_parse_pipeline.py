@@ -0,0 +1,122 @@
+"""
+Measure how title page parsing scales across cores.
+
+Replays saved title pages (or synthetic ones) through two setups:
+  - threads only: every thread downloads and parses, sharing one GIL
+  - FetchParsePipeline: threads download, a process pool parses
+Network latency is simulated with a sleep per page, so the run needs no
+network access.
+
+Usage:
+    python benchmarks/bench_parse_pipeline.py [--fixtures DIR] [--pages 200]
+                                              [--latency 0.05] [--threads 8]
+
+With --fixtures, every *.html file in DIR is replayed in a loop; save a few
+pages from https://www.imdb.com/title/<id>/ there for realistic numbers.
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from fetch_movies import parse_title_page  # noqa: E402
+from pipeline import FetchParsePipeline  # noqa: E402
+
+
+def synthetic_title_page(i):
+    """Return a title page with the elements parse_title_page looks for."""
+    filler = "".join(
+        f'<div class="ipc-metadata-list-item"><a href="/name/nm{j:07d}/">Cast Member {j}</a>'
+        f'<span class="character">Character {j}</span></div>'
+        for j in range(400)
+    )
+    return (
+        "<html><body>"
+        f'<section data-testid="hero-media__poster"><img src="https://example.com/{i}.jpg"/></section>'
+        f'<div data-testid="hero-rating-bar__aggregate-rating__score"><span>8.{i % 10}</span></div>'
+        '<div data-testid="genres"><a>Drama</a><a>Crime</a></div>'
+        f'<span data-testid="plot">Synthetic plot number {i}.</span>'
+        '<li data-testid="title-pc-principal-credit"><a href="/name/nm1/?ref_=tt_ov_director">A Director</a></li>'
+        '<li data-testid="title-details-releasedate"><a>March 24, 1972 (United States)</a></li>'
+        f"{filler}</body></html>"
+    ).encode("utf-8")
+
+
+def load_pages(fixtures, count):
+    """Return count raw pages, cycling through the fixtures if given."""
+    if fixtures:
+        paths = sorted(glob.glob(os.path.join(fixtures, "*.html")))
+        if not paths:
+            sys.exit(f"No .html fixtures found in {fixtures}")
+        sources = []
+        for path in paths:
+            with open(path, "rb") as f:
+                sources.append(f.read())
+    else:
+        sources = [synthetic_title_page(i) for i in range(20)]
+    return [sources[i % len(sources)] for i in range(count)]
+
+
+def make_fetch(pages, latency):
+    """Return a fetch_page(url) that replays pages after a simulated delay."""
+    def fetch_page(url):
+        time.sleep(latency)
+        return pages[int(url.rsplit("/", 1)[-1])]
+    return fetch_page
+
+
+def run_threaded(pages, latency, threads):
+    fetch_page = make_fetch(pages, latency)
+
+    def fetch_and_parse(i):
+        return parse_title_page(fetch_page(f"replay/{i}"), f"tt{i:07d}")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(fetch_and_parse, range(len(pages))))
+    return time.perf_counter() - start
+
+
+def run_pipeline(pages, latency, threads, parse_workers):
+    pipeline = FetchParsePipeline(make_fetch(pages, latency), parse_title_page,
+                                  network_workers=threads, parse_workers=parse_workers)
+    jobs = ((f"tt{i:07d}", f"replay/{i}") for i in range(len(pages)))
+
+    start = time.perf_counter()
+    for _, _, error in pipeline.run(jobs):
+        if error is not None:
+            raise error
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fixtures", help="Directory of saved title pages (*.html)")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated seconds per download")
+    parser.add_argument("--threads", type=int, default=8, help="Download threads")
+    args = parser.parse_args()
+
+    pages = load_pages(args.fixtures, args.pages)
+    cores = os.cpu_count() or 1
+
+    baseline = run_threaded(pages, args.latency, args.threads)
+    print(f"{'setup':<28}{'seconds':>10}{'pages/s':>10}{'speedup':>10}")
+    print(f"{f'threads only ({args.threads})':<28}{baseline:>10.2f}{len(pages) / baseline:>10.1f}{1:>10.2f}")
+
+    workers = 1
+    while True:
+        elapsed = run_pipeline(pages, args.latency, args.threads, workers)
+        print(f"{f'pipeline, {workers} parse procs':<28}{elapsed:>10.2f}"
+              f"{len(pages) / elapsed:>10.1f}{baseline / elapsed:>10.2f}")
+        if workers >= cores:
+            break
+        workers = min(cores, workers * 2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Measure how long the Tk event loop stalls while the app works.
+
+Drives a real IMDbApp through a script of list populations and movie
+selections, scheduled with root.after like user input, while a
+MainLoopWatchdog samples event-loop latency. IMDb is replayed from
+synthetic pages with a simulated delay per request, so the run needs no
+network access, and each population starts from an empty cache so every
+title page is fetched again.
+
+Without a DISPLAY an Xvfb server is started for the run (needs the xvfb
+package, e.g. apt install xvfb). The app imports ai_api, so openai must be
+installed; no AI calls are made.
+
+Usage:
+    python benchmarks/bench_ui_responsiveness.py [--rounds 2] [--movies 10]
+                                                 [--latency 0.1] [--threshold 100]
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+# ai_api builds its client at import time; the benchmark never calls it
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+import tkinter as tk  # noqa: E402
+
+from app_gui import IMDbApp  # noqa: E402
+from fetch_movies import MovieManager  # noqa: E402
+from ui_watchdog import MainLoopWatchdog, percentile  # noqa: E402
+
+XVFB_DISPLAY = ":99"
+
+
+def start_xvfb():
+    """Start Xvfb if there is no display, returning the process (or None)."""
+    if os.environ.get("DISPLAY"):
+        return None
+    if not shutil.which("Xvfb"):
+        sys.exit("No DISPLAY set and Xvfb is not installed")
+
+    proc = subprocess.Popen(["Xvfb", XVFB_DISPLAY, "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    socket = f"/tmp/.X11-unix/X{XVFB_DISPLAY.lstrip(':')}"
+    deadline = time.monotonic() + 10
+    while not os.path.exists(socket):
+        if proc.poll() is not None or time.monotonic() > deadline:
+            proc.kill()
+            sys.exit("Xvfb failed to start")
+        time.sleep(0.05)
+    os.environ["DISPLAY"] = XVFB_DISPLAY
+    return proc
+
+
+def chart_page(count):
+    """Return a chart page with the elements _fetch_chart_entries looks for."""
+    items = "".join(
+        f'<li class="ipc-metadata-list-summary-item">'
+        f'<a href="/title/tt{i:07d}/"><h3 class="ipc-title__text">{i}. Synthetic Movie {i}</h3></a>'
+        f'<span class="ipc-rating-star--rating">8.{i % 10}</span></li>'
+        for i in range(1, count + 1)
+    )
+    return f"<html><body><ul>{items}</ul></body></html>"
+
+
+def title_page(imdb_id):
+    """Return a title page with the elements parse_title_page looks for, minus a poster."""
+    filler = "".join(
+        f'<div class="ipc-metadata-list-item"><a href="/name/nm{j:07d}/">Cast Member {j}</a></div>'
+        for j in range(200)
+    )
+    return (
+        "<html><body>"
+        '<div data-testid="hero-rating-bar__aggregate-rating__score"><span>8.5</span></div>'
+        '<div data-testid="genres"><a>Drama</a><a>Crime</a></div>'
+        f'<span data-testid="plot">Synthetic plot for {imdb_id}.</span>'
+        '<li data-testid="title-pc-principal-credit"><a href="/name/nm1/?ref_=tt_ov_director">A Director</a></li>'
+        '<li data-testid="title-details-releasedate"><a>March 24, 1972 (United States)</a></li>'
+        f"{filler}</body></html>"
+    )
+
+
+class ReplayResponse:
+    def __init__(self, text):
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.status_code = 200
+
+
+def make_manager_class(movie_count, latency):
+    """Return a MovieManager subclass that replays IMDb after a simulated delay."""
+
+    class ReplayMovieManager(MovieManager):
+        def _get(self, url, stage, max_retries=3, retry_delay=1.0):
+            time.sleep(latency)
+            self.request_stats.increment("requests")
+            if "/title/" in url:
+                imdb_id = url.split("/title/", 1)[1].split("/", 1)[0]
+                return ReplayResponse(title_page(imdb_id))
+            return ReplayResponse(chart_page(movie_count))
+
+    return ReplayMovieManager
+
+
+def summarize(label, values):
+    print(f"{label:<28}{len(values):>8}{percentile(values, 50):>10.0f}"
+          f"{percentile(values, 99):>10.0f}{max(values, default=0.0):>10.0f}")
+
+
+def run(args):
+    manager_class = make_manager_class(args.movies, args.latency)
+    root = tk.Tk()
+    app = IMDbApp(root)
+    app.movie_manager = manager_class()
+
+    stall_log = []
+    log = print if args.verbose else stall_log.append
+    watchdog = MainLoopWatchdog(root, interval_ms=args.interval, threshold_ms=args.threshold, log=log)
+    app.watchdog = watchdog
+
+    # Time each action's callback directly as well: that is how long the
+    # window stayed frozen after the simulated click
+    blocked = {"populate": [], "select": []}
+
+    def populate():
+        app.movie_manager = manager_class()
+        app.populate_movie_list()
+
+    steps = []
+    for _ in range(args.rounds):
+        steps.append(("populate", populate))
+        steps.extend(("select", lambda i=i: app.select_movie(i)) for i in range(args.movies))
+
+    def run_step(index):
+        if index == len(steps):
+            root.after(args.settle, root.quit)
+            return
+        name, action = steps[index]
+        start = time.perf_counter()
+        action()
+        blocked[name].append((time.perf_counter() - start) * 1000)
+        # Leave the loop idle between actions so the heartbeat keeps sampling
+        root.after(args.settle, run_step, index + 1)
+
+    watchdog.start()
+    root.after(args.settle, run_step, 0)
+    root.mainloop()
+    watchdog.stop()
+    root.destroy()
+
+    print(f"{'milliseconds':<28}{'count':>8}{'p50':>10}{'p99':>10}{'max':>10}")
+    summarize("populate_movie_list", blocked["populate"])
+    summarize("select_movie", blocked["select"])
+    summarize("event-loop latency", list(watchdog.latencies))
+    summarize(f"stalls > {args.threshold} ms", list(watchdog.stalls))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=2, help="List populations to run")
+    parser.add_argument("--movies", type=int, default=10, help="Movies per list (and selections per round)")
+    parser.add_argument("--latency", type=float, default=0.1, help="Simulated seconds per request")
+    parser.add_argument("--interval", type=int, default=20, help="Heartbeat interval in ms")
+    parser.add_argument("--threshold", type=int, default=100, help="Stall threshold in ms")
+    parser.add_argument("--settle", type=int, default=200, help="Idle ms between actions")
+    parser.add_argument("--verbose", action="store_true", help="Print each stall with its stack")
+    args = parser.parse_args()
+
+    xvfb = start_xvfb()
+    try:
+        run(args)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+
+
+if __name__ == "__main__":
+    main()
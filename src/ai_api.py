@@ -1,12 +1,21 @@
 import os
+import base64
 from openai import OpenAI
 from dotenv import load_dotenv
+from singleflight import SingleFlight, single_flight
 
 load_dotenv()
 
+IMAGE_SIZE = (512, 512)
+
 client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
+# Identical requests made while one is already running (e.g. repeated clicks)
+# wait for and share that request's result instead of calling the API again
+ai_requests = SingleFlight()
+
 
+@single_flight(ai_requests)
 def get_dialogue(storyline, num_characters, max_words):
     """
     Returns the generated dialogue as a string value.
@@ -35,6 +44,7 @@ def get_dialogue(storyline, num_characters, max_words):
     )
     return response.choices[0].message.content
 
+@single_flight(ai_requests)
 def get_scene_description(dialogue):
     """
     Uses LLM to extract or generate a short scene description (atmosphere)
@@ -54,30 +64,42 @@ def get_scene_description(dialogue):
             {"role": "user", "content": prompt}
         ],
         temperature=0.5,
-        max_tokens=510  # ~1000 characters max (including the addition to the prompt in the get_image method)
+        max_tokens=510  # ~1000 characters max (including the addition to the prompt in get_image_prompt)
     )
     return response.choices[0].message.content.strip()
 
-def get_image(location, style, dialogue):
+def get_image_prompt(location, style, dialogue):
     """
-    Returns a URL to the generated image.
+    Returns the image generation prompt for a dialogue.
     Parameters:
         location (str): The location of the image.
         style (str): The style of the image.
         dialogue (str): The dialogue generated by get_dialogue.
     """
-
     scene_description = get_scene_description(dialogue)
 
     prompt = f"{scene_description} The scene is set in {location}, depicted in a {style} style. The image should be a depiction of the description provided."
-    prompt = prompt[:1000]
+    return prompt[:1000]
+
+@single_flight(ai_requests)
+def get_image_bytes(location, style, dialogue):
+    """
+    Returns the generated image as PNG bytes, returned inline by the API
+    instead of as a URL that needs a second download.
+    Parameters:
+        location (str): The location of the image.
+        style (str): The style of the image.
+        dialogue (str): The dialogue generated by get_dialogue.
+    """
+    prompt = get_image_prompt(location, style, dialogue)
     try:
         response = client.images.generate(
             prompt=prompt,
             n=1,
-            size="512x512"
+            size=f"{IMAGE_SIZE[0]}x{IMAGE_SIZE[1]}",
+            response_format="b64_json"
         )
-        return response.data[0].url
+        return base64.b64decode(response.data[0].b64_json)
     except Exception as e:
         print("Image generation failed:", e)
         return None
@@ -4,9 +4,10 @@ from tkinter import ttk
 from tkinter import font as tkFont
 from tkinter import scrolledtext, messagebox
 import webbrowser
-from fetch_movies import MovieManager
-from ai_api import get_dialogue, get_image
-from PIL import Image, ImageTk
+from fetch_movies import MovieManager, CHARTS
+from ai_api import get_dialogue, get_image_bytes, IMAGE_SIZE, ai_requests
+from image_cache import TkImageManager, make_thumbnail
+from PIL import Image
 import io
 import requests
 
@@ -19,10 +20,19 @@ DARK_BUTTON_BG = "#555555"
 DARK_BUTTON_FG = "#ffffff"
 ACCENT_COLOR = "#4a90e2"
 
+# Delay after the last keystroke before the search box runs a query
+SEARCH_DEBOUNCE_MS = 250
+# Delay after the list stops scrolling before visible storylines are prefetched
+PREFETCH_DEBOUNCE_MS = 500
+# How often the stats line under the movie list is refreshed
+STATS_REFRESH_MS = 2000
+
+POSTER_SIZE = (80, 120)
+
 
 class IMDbApp:
 
-    def __init__(self, root):
+    def __init__(self, root, prefetch_storylines=False, image_budget_mb=32):
 
         self.root = root
         self.root.title("Enhanced IMDb Movie Explorer")
@@ -31,12 +41,26 @@ class IMDbApp:
 
         self.movie_manager = MovieManager()
 
-        self.selected_rank = None
+        self.selected_id = None
         self.selected_title = None
 
+        # Keyed by IMDb ID so cached results survive re-ranking
         self.last_generated_dialogue = {}
         self.top_movies = []
-        self.poster_images = {}
+        self.listed_movies = []
+        # IMDb ID -> (poster_label, title_label, poster_url) for rows on screen
+        self.movie_rows = {}
+        # Posters and generated images, decoded within a memory budget; also
+        # the only copy of each movie's last generated PNG, kept for saving
+        self.image_manager = TkImageManager(budget_bytes=image_budget_mb * 1024 * 1024)
+        self._search_after_id = None
+
+        # Fetch storylines for rows as they scroll into view, not just on click
+        self.prefetch_storylines = prefetch_storylines
+        self._prefetch_after_id = None
+
+        # Optional MainLoopWatchdog whose latency figures are shown in the stats line
+        self.watchdog = None
 
         self.default_font = tkFont.nametofont("TkDefaultFont")
         self.default_font.configure(size=10)
@@ -45,6 +69,7 @@ class IMDbApp:
 
         self.setup_styles()
         self.create_ui_layout()
+        self.update_stats_label()
 
     def setup_styles(self):
         """Configures ttk styles for a dark theme."""
@@ -86,7 +111,23 @@ class IMDbApp:
 
     def create_left_frame(self):
         """Creates the widgets for the left frame (movie list with posters)."""
-        ttk.Label(self.left_frame, text="Top IMDb Movies", style="Header.TLabel").pack(pady=(0, 10))
+        self.list_header_label = ttk.Label(self.left_frame, text="Top IMDb Movies", style="Header.TLabel")
+        self.list_header_label.pack(pady=(0, 10))
+
+        self.chart_var = tk.StringVar()
+        self.chart_combobox = ttk.Combobox(
+            self.left_frame,
+            textvariable=self.chart_var,
+            values=[label for label, _ in CHARTS.values()],
+            state="readonly"
+        )
+        self.chart_combobox.pack(fill=tk.X, pady=(0, 10))
+        self.chart_combobox.bind("<<ComboboxSelected>>", lambda e: self.on_chart_selected())
+
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(self.left_frame, textvariable=self.search_var)
+        self.search_entry.pack(fill=tk.X, pady=(0, 10))
+        self.search_var.trace_add("write", lambda *args: self.on_search_changed())
 
         list_frame = ttk.Frame(self.left_frame, style="Dark.TFrame")
         list_frame.pack(fill=tk.BOTH, expand=True)
@@ -106,7 +147,11 @@ class IMDbApp:
         )
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        self.movies_canvas.configure(yscrollcommand=scrollbar.set)
+        def on_canvas_scroll(first, last):
+            scrollbar.set(first, last)
+            self.schedule_storyline_prefetch()
+
+        self.movies_canvas.configure(yscrollcommand=on_canvas_scroll)
 
         self.movie_items_frame = ttk.Frame(self.movies_canvas, style="Dark.TFrame")
 
@@ -125,6 +170,9 @@ class IMDbApp:
 
         self.movies_canvas.bind("<Configure>", on_canvas_configure)
 
+        self.stats_label = ttk.Label(self.left_frame, text="", wraplength=250)
+        self.stats_label.pack(fill=tk.X, pady=(10, 0))
+
 
     def create_right_frame(self):
         """Creates the widgets for the right frame (details and AI)."""
@@ -255,15 +303,31 @@ class IMDbApp:
         image_tab = ttk.Frame(self.notebook, style="Dark.TFrame", padding=10)
         self.notebook.add(image_tab, text=' Generated Image ')
 
+        image_save_frame = ttk.Frame(image_tab, style="Dark.TFrame")
+        image_save_frame.grid(row=0, column=0, sticky="ew", pady=(0, 10))
+
+        ttk.Label(image_save_frame, text="Filename:").pack(side=tk.LEFT, padx=(0, 5))
+
+        self.image_filename_var = tk.StringVar()
+        self.image_filename_entry = ttk.Entry(image_save_frame, textvariable=self.image_filename_var, width=30)
+        self.image_filename_entry.pack(side=tk.LEFT, padx=(0, 10))
+
+        self.save_image_button = ttk.Button(
+            image_save_frame,
+            text="Save Image to File",
+            command=self.save_image_to_file
+        )
+        self.save_image_button.pack(side=tk.LEFT)
+
         self.image_label = ttk.Label(
             image_tab,
             text="Image will appear here",
             anchor=tk.CENTER,
             background=DARK_LISTBOX_BG
         )
-        image_tab.rowconfigure(0, weight=1)
+        image_tab.rowconfigure(1, weight=1)
         image_tab.columnconfigure(0, weight=1)
-        self.image_label.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
+        self.image_label.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
 
     def create_ui_layout(self):
         """Create the main UI layout with frames."""
@@ -276,14 +340,29 @@ class IMDbApp:
         self.create_left_frame()
         self.create_right_frame()
 
+    def on_chart_selected(self):
+        """Switches the list to the chosen chart, reusing any movies already fetched."""
+        label = self.chart_var.get()
+        chart = next(key for key, (chart_label, _) in CHARTS.items() if chart_label == label)
+        if chart == self.movie_manager.active_chart:
+            return
+
+        self.movie_manager.set_active_chart(chart)
+        self.search_var.set("")
+        self.populate_movie_list()
+
     def populate_movie_list(self):
-        """Fetches and displays the IMDb top 10 movies with posters."""
+        """Fetches and displays the top 10 movies of the active chart with posters."""
+        chart_label = CHARTS[self.movie_manager.active_chart][0]
+        self.chart_var.set(chart_label)
+        self.list_header_label.config(text=f"IMDb {chart_label}")
+
         for widget in self.movie_items_frame.winfo_children():
 
             # Remove the poster image if available
             widget.destroy()
 
-        loading_label = ttk.Label(self.movie_items_frame, text="Loading IMDb top 10...", style="TLabel")
+        loading_label = ttk.Label(self.movie_items_frame, text=f"Loading {chart_label}...", style="TLabel")
         loading_label.pack(pady=10, padx=5, fill=tk.X)
 
         # Force canvas to update and display the loading label
@@ -291,67 +370,160 @@ class IMDbApp:
 
         try:
 
-            movies = self.movie_manager.fetch_top_movies(limit=10)
-            self.movie_manager.fetch_all_details()
+            self.movie_manager.fetch_top_movies(limit=10)
+            movies = self.movie_manager.fetch_all_details(max_rank=10)
 
             loading_label.destroy()
 
-            # Initialize or reset the top_movies list
-            self.top_movies = []
+            self.listed_movies = [movie for _, movie in sorted(movies.items())]
+            self.render_movie_rows(self.listed_movies)
 
-            for rank, movie in sorted(movies.items()):
-                title = movie['title']
-                self.top_movies.append((rank, title))
+        except Exception as e:
+            for widget in self.movie_items_frame.winfo_children():
+                widget.destroy()
 
-                movie_frame = ttk.Frame(self.movie_items_frame, style="Dark.TFrame", padding=5)
-                movie_frame.pack(fill=tk.X, pady=2)
+            error_label = ttk.Label(self.movie_items_frame, text=f"Error fetching movies: {str(e)}", style="TLabel")
+            error_label.pack(pady=10, padx=5)
+            messagebox.showerror("Fetch Error", f"Failed to fetch movies: {str(e)}")
+            print(f"Error fetching top movies: {e}")
 
-                poster_url = self.movie_manager.movies[rank].get('poster_url')
+    def render_movie_rows(self, movies):
+        """Replaces the movie list with one row per movie, in the given order."""
+        for widget in self.movie_items_frame.winfo_children():
+            widget.destroy()
 
-                # Placeholder label for movie poster image
-                poster_label = ttk.Label(movie_frame, background=DARK_LISTBOX_BG)
+        # Initialize or reset the top_movies list
+        self.top_movies = []
+        self.movie_rows = {}
 
-                if poster_url:
-                    try:
-                        threading.Thread(
-                            target=self.load_poster_image,
-                            args=(poster_url, poster_label, rank),
-                            daemon=True
-                        ).start()
-                    except Exception:
-                        poster_label.config(text="No image")
-                else:
-                    poster_label.config(text="No image")
+        # Mark the new rows as on screen before decoding any poster, so one
+        # decoded for an earlier row of this pass is never evicted by a later one;
+        # posters of rows that were just removed can now be evicted
+        self.image_manager.set_displayed([movie['imdb_id'] for movie in movies], group="rows")
 
-                # Position the poster label in the grid layout
-                poster_label.grid(row=0, column=0, padx=5, pady=2)
+        for index, movie in enumerate(movies):
+            title = movie['title']
+            imdb_id = movie['imdb_id']
+            self.top_movies.append((imdb_id, title))
 
-                title_label = ttk.Label(
-                    movie_frame,
-                    text=title,
-                    wraplength=150,
-                    anchor=tk.W,
-                    background=DARK_LISTBOX_BG,
-                    padding=(5, 10)
-                )
-                title_label.grid(row=0, column=1, sticky="nsew", padx=5, pady=2)
-                movie_frame.columnconfigure(1, weight=1)
+            movie_frame = ttk.Frame(self.movie_items_frame, style="Dark.TFrame", padding=5)
+            movie_frame.pack(fill=tk.X, pady=2)
 
-                def make_select_handler(idx):
-                    return lambda e: self.select_movie(idx)
+            poster_url = movie.get('poster_url')
 
-                movie_frame.bind("<Button-1>", make_select_handler(rank - 1))
-                title_label.bind("<Button-1>", make_select_handler(rank - 1))
-                poster_label.bind("<Button-1>", make_select_handler(rank - 1))
+            # Placeholder label for movie poster image
+            poster_label = ttk.Label(movie_frame, background=DARK_LISTBOX_BG)
 
-        except Exception as e:
-            for widget in self.movie_items_frame.winfo_children():
-                widget.destroy()
+            if imdb_id in self.image_manager:
+                poster_label.config(image=self.image_manager.get(imdb_id))
+            elif poster_url:
+                try:
+                    threading.Thread(
+                        target=self.load_poster_image,
+                        args=(poster_url, poster_label, imdb_id),
+                        daemon=True
+                    ).start()
+                except Exception:
+                    poster_label.config(text="No image")
+            else:
+                poster_label.config(text="No image")
+
+            # Position the poster label in the grid layout
+            poster_label.grid(row=0, column=0, padx=5, pady=2)
+
+            title_label = ttk.Label(
+                movie_frame,
+                text=title,
+                wraplength=150,
+                anchor=tk.W,
+                background=DARK_LISTBOX_BG,
+                padding=(5, 10)
+            )
+            title_label.grid(row=0, column=1, sticky="nsew", padx=5, pady=2)
+            movie_frame.columnconfigure(1, weight=1)
+            self.movie_rows[imdb_id] = (poster_label, title_label, poster_url)
+
+            def make_select_handler(idx):
+                return lambda e: self.select_movie(idx)
+
+            movie_frame.bind("<Button-1>", make_select_handler(index))
+            title_label.bind("<Button-1>", make_select_handler(index))
+            poster_label.bind("<Button-1>", make_select_handler(index))
+
+        self.schedule_storyline_prefetch()
+
+    def schedule_storyline_prefetch(self):
+        """Queues a storyline prefetch for the visible rows once scrolling settles."""
+        if not self.prefetch_storylines:
+            return
+        if self._prefetch_after_id is not None:
+            self.root.after_cancel(self._prefetch_after_id)
+        self._prefetch_after_id = self.root.after(PREFETCH_DEBOUNCE_MS, self.prefetch_visible_storylines)
+
+    def prefetch_visible_storylines(self):
+        """Fetches storylines in the background for the rows currently on screen."""
+        self._prefetch_after_id = None
+        top = self.movies_canvas.canvasy(0)
+        bottom = top + self.movies_canvas.winfo_height()
+
+        visible_ids = []
+        rows = self.movie_items_frame.winfo_children()
+        for (imdb_id, _), row in zip(self.top_movies, rows):
+            row_top = row.winfo_y()
+            if row_top + row.winfo_height() >= top and row_top <= bottom:
+                visible_ids.append(imdb_id)
+
+        if visible_ids:
+            threading.Thread(
+                target=self.movie_manager.prefetch_storylines,
+                args=(visible_ids,),
+                daemon=True
+            ).start()
+
+    def update_movie_rows(self, imdb_ids):
+        """Refreshes the rows (and details panel) of updated movies in place."""
+        for imdb_id in imdb_ids:
+            movie = self.movie_manager.get_movie(imdb_id)
+            if movie is None or imdb_id not in self.movie_rows:
+                continue
+
+            poster_label, title_label, shown_poster_url = self.movie_rows[imdb_id]
+            title_label.config(text=movie['title'])
+
+            poster_url = movie.get('poster_url')
+            if poster_url and poster_url != shown_poster_url:
+                # The row keeps showing the old poster until the new one is ready
+                threading.Thread(
+                    target=self.load_poster_image,
+                    args=(poster_url, poster_label, imdb_id),
+                    daemon=True
+                ).start()
+            self.movie_rows[imdb_id] = (poster_label, title_label, poster_url)
+
+            if imdb_id == self.selected_id:
+                self.title_label.config(text=f"{movie.get('title', 'Unknown')} ({movie.get('year', 'N/A')})")
+                self.set_text_widget_content(self.description_text,
+                                             movie.get('description', 'No description available.'))
+
+    def on_search_changed(self):
+        """Debounces search box edits so a query runs only once typing pauses."""
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(SEARCH_DEBOUNCE_MS, self.apply_search)
+
+    def apply_search(self):
+        """Shows the movies matching the search box, or the full list when empty."""
+        self._search_after_id = None
+        query = self.search_var.get().strip()
+
+        if not query:
+            self.render_movie_rows(self.listed_movies)
+            return
 
-            error_label = ttk.Label(self.movie_items_frame, text=f"Error fetching movies: {str(e)}", style="TLabel")
-            error_label.pack(pady=10, padx=5)
-            messagebox.showerror("Fetch Error", f"Failed to fetch movies: {str(e)}")
-            print(f"Error fetching top movies: {e}")
+        results = self.movie_manager.search(query, limit=50)
+        self.render_movie_rows(results)
+        if not results:
+            ttk.Label(self.movie_items_frame, text="No matching movies", style="TLabel").pack(pady=10, padx=5)
 
     def set_text_widget_content(self, text_widget, content):
         """Helper to safely update content in a disabled Text widget."""
@@ -369,15 +541,15 @@ class IMDbApp:
         self.set_text_widget_content(self.storyline_text, "")
         self.set_text_widget_content(self.dialogue_output_text, "")
         self.image_label.config(image="", text="Select a movie")
+        self.image_manager.set_displayed([], group="generated")
 
     def generate_dialogue(self):
         """Generate a dialogue based on the selected movie."""
-        if not hasattr(self, 'selected_rank') or not self.selected_rank:
+        if not self.selected_id:
             self.set_text_widget_content(self.dialogue_output_text, "Error: Please select a movie first.")
             return
 
-        movie_data = self.movie_manager.fetch_movie_details_by_rank(self.selected_rank)
-        storyline = movie_data.get('storyline', '')
+        imdb_id = self.selected_id
         num_chars = self.char_count_var.get()
         max_words = self.max_words_var.get()
 
@@ -386,8 +558,9 @@ class IMDbApp:
 
         def worker():
             try:
+                storyline = self.movie_manager.fetch_storyline(imdb_id) or ''
                 dialogue = get_dialogue(storyline, num_chars, max_words)
-                self.last_generated_dialogue[self.selected_title] = dialogue
+                self.last_generated_dialogue[imdb_id] = dialogue
                 self.root.after(0, lambda: self.set_text_widget_content(self.dialogue_output_text, dialogue))
             except Exception as e:
                 self.root.after(0, lambda: messagebox.showerror("Dialogue Error",
@@ -415,29 +588,50 @@ class IMDbApp:
         except Exception as e:
             messagebox.showerror("Save Error", f"Failed to save dialogue: {e}")
 
+    def save_image_to_file(self):
+        """Save the selected movie's generated image to a user-named PNG file."""
+        filename = self.image_filename_var.get().strip()
+        if not filename:
+            messagebox.showwarning("Filename Missing", "Please enter a filename.")
+            return
+
+        image_data = self.image_manager.get_bytes(("generated", self.selected_id))
+        if not image_data:
+            messagebox.showwarning("No Image", "No image available to save.")
+            return
+
+        try:
+            full_filename = f"{filename}.png"
+            with open(full_filename, "wb") as f:
+                f.write(image_data)
+            messagebox.showinfo("Success", f"Image saved as '{full_filename}'.")
+        except Exception as e:
+            messagebox.showerror("Save Error", f"Failed to save image: {e}")
+
     def generate_image(self):
         """Generate an image based on the selected movie."""
-        if not hasattr(self, 'selected_rank') or not self.selected_rank:
+        if not self.selected_id:
             self.image_label.config(text="Error: Please select a movie first.")
             return
 
+        imdb_id = self.selected_id
         location = self.location_var.get().strip() or "Unknown location"
         style = self.style_var.get() or "Futuristic"
 
         self.image_label.config(image="", text="Generating image, please wait...")
+        self.image_manager.set_displayed([], group="generated")
         self.notebook.select(2)
 
         def worker():
-            if self.selected_title in self.last_generated_dialogue:
-                dialogue = self.last_generated_dialogue[self.selected_title]
+            if imdb_id in self.last_generated_dialogue:
+                dialogue = self.last_generated_dialogue[imdb_id]
             else:
                 try:
-                    movie_data = self.movie_manager.fetch_movie_details_by_rank(self.selected_rank)
-                    storyline = movie_data.get('storyline', 'No storyline available.')
+                    storyline = self.movie_manager.fetch_storyline(imdb_id) or 'No storyline available.'
                     num_chars = self.char_count_var.get()
                     max_words = self.max_words_var.get()
                     dialogue = get_dialogue(storyline, num_chars, max_words)
-                    self.last_generated_dialogue[self.selected_title] = dialogue
+                    self.last_generated_dialogue[imdb_id] = dialogue
                     self.root.after(0, lambda: self.set_text_widget_content(self.dialogue_output_text, dialogue))
                 except Exception as e:
                     self.root.after(0, lambda: messagebox.showerror("Dialogue Error",
@@ -445,23 +639,22 @@ class IMDbApp:
                     return
 
             try:
-                image_url = get_image(location, style, dialogue)
-                if not image_url:
+                image_data = get_image_bytes(location, style, dialogue)
+                if not image_data:
                     self.root.after(0, lambda: self.image_label.config(text="Image generation failed."))
                     return
 
                 try:
-                    response = requests.get(image_url)
-                    response.raise_for_status()
-                    image_data = response.content
-
                     pil_image = Image.open(io.BytesIO(image_data))
-                    pil_image = pil_image.resize((512, 512))
-                    tk_image = ImageTk.PhotoImage(pil_image)
+                    if pil_image.size != IMAGE_SIZE:
+                        image_data = make_thumbnail(image_data, IMAGE_SIZE)
 
                     def update_gui_with_image():
-                        self.image_label.config(image=tk_image, text="")
-                        self.image_label.image = tk_image
+                        key = ("generated", imdb_id)
+                        self.image_manager.put(key, image_data)
+                        # Mark it shown before decoding so it cannot be evicted on arrival
+                        self.image_manager.set_displayed([key], group="generated")
+                        self.image_label.config(image=self.image_manager.refresh(key), text="")
 
                     self.root.after(0, update_gui_with_image)
 
@@ -473,32 +666,69 @@ class IMDbApp:
 
         threading.Thread(target=worker, daemon=True).start()
 
-    def load_poster_image(self, url, label, rank):
+    def load_poster_image(self, url, label, imdb_id):
         """Load movie poster from URL and display in label."""
         try:
             response = requests.get(url)
             response.raise_for_status()
 
-            img_data = response.content
-            img = Image.open(io.BytesIO(img_data))
-
-            img = img.resize((80, 120), Image.LANCZOS)
-
-            tk_img = ImageTk.PhotoImage(img)
-
-            self.poster_images[rank] = tk_img
+            # Resize here so the Tk thread only decodes the small thumbnail
+            self.image_manager.put(imdb_id, make_thumbnail(response.content, POSTER_SIZE))
 
             def update_label():
-                label.config(image=tk_img)
+                if label.winfo_exists():
+                    # Decode again in case an older poster was already decoded
+                    label.config(image=self.image_manager.refresh(imdb_id))
 
             self.root.after(0, update_label)
         except Exception as e:
             def update_error():
-                label.config(text="Image\nError")
+                if label.winfo_exists():
+                    label.config(text="Image\nError")
 
             self.root.after(0, update_error)
             print(f"Error loading poster: {e}")
 
+    def get_stats(self):
+        """Returns fetch and image memory statistics as a dict."""
+        stats = self.movie_manager.get_stats()
+        stats.update(self.image_manager.stats())
+        stats["duplicate_ai_requests_avoided"] = ai_requests.shared
+        if self.watchdog is not None:
+            stats.update({f"ui_{key}": value for key, value in self.watchdog.stats().items()})
+        return stats
+
+    def update_stats_label(self):
+        """Refreshes the stats line under the movie list."""
+        stats = self.get_stats()
+        self.stats_label.config(
+            text=f"Images: {stats['images']} ({stats['image_bytes'] / 1024 / 1024:.1f} of "
+                 f"{stats['budget_bytes'] / 1024 / 1024:.0f} MB) | "
+                 f"Requests: {stats['requests']} ({stats['retries']} retries) | "
+                 f"Duplicates avoided: {stats['duplicate_fetches_avoided']} fetches, "
+                 f"{stats['duplicate_ai_requests_avoided']} AI calls"
+                 + (f" | UI p99: {stats['ui_p99_ms']:.0f} ms ({stats['ui_stalls']} stalls)"
+                    if self.watchdog is not None else "")
+        )
+        self.root.after(STATS_REFRESH_MS, self.update_stats_label)
+
+    def load_storyline(self, imdb_id):
+        """Fetch a storyline in the background and show it if the movie is still selected."""
+        def worker():
+            try:
+                storyline = self.movie_manager.fetch_storyline(imdb_id) or 'No storyline available.'
+            except Exception as e:
+                print(f"Error loading storyline: {e}")
+                storyline = 'No storyline available.'
+
+            def update_storyline():
+                if self.selected_id == imdb_id:
+                    self.set_text_widget_content(self.storyline_text, storyline)
+
+            self.root.after(0, update_storyline)
+
+        threading.Thread(target=worker, daemon=True).start()
+
     def select_movie(self, index):
         """Handle selection of a movie from the list."""
         if index < 0 or index >= len(self.top_movies):
@@ -513,8 +743,8 @@ class IMDbApp:
                     if isinstance(widget, ttk.Label):
                         widget.configure(background=DARK_LISTBOX_BG)
 
-        rank, movie_title = self.top_movies[index]
-        self.selected_rank = rank
+        imdb_id, movie_title = self.top_movies[index]
+        self.selected_id = imdb_id
         self.selected_title = movie_title
 
         self.set_text_widget_content(self.description_text, "Loading movie details...")
@@ -522,7 +752,7 @@ class IMDbApp:
         self.root.update()
 
         try:
-            movie_data = self.movie_manager.fetch_movie_details_by_rank(rank)
+            movie_data = self.movie_manager.fetch_movie_details_by_id(imdb_id)
             self.title_label.config(text=f"{movie_data.get('title', 'Unknown')} ({movie_data.get('year', 'N/A')})")
 
             url = movie_data.get('url', '')
@@ -532,13 +762,16 @@ class IMDbApp:
 
             self.set_text_widget_content(self.description_text,
                                          movie_data.get('description', 'No description available.'))
-            self.set_text_widget_content(self.storyline_text,
-                                         movie_data.get('storyline', 'No storyline available.'))
+            if movie_data.get('storyline_fetched', False):
+                self.set_text_widget_content(self.storyline_text,
+                                             movie_data.get('storyline', 'No storyline available.'))
+            else:
+                self.load_storyline(imdb_id)
 
             self.generate_dialogue_button.config(state=tk.NORMAL)
             self.generate_image_button.config(state=tk.NORMAL)
 
-            self.selected_rank = rank
+            self.selected_id = imdb_id
             self.selected_title = movie_title
 
             self.notebook.select(0)
@@ -0,0 +1,158 @@
+import csv
+import json
+import os
+
+from movie import MOVIE_FIELDS
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+EXPORT_FORMATS = ("jsonl", "csv", "parquet", "arrow")
+
+# Column types for the columnar formats; everything else is a string
+_ARROW_TYPES = {
+    "rank": pyarrow.int64,
+    "details_fetched": pyarrow.bool_,
+    "storyline_fetched": pyarrow.bool_,
+    "fetched_at": pyarrow.float64,
+} if pyarrow is not None else {}
+
+
+def project_record(movie, fields):
+    """Return a plain dict of the given fields of a movie."""
+    return {field: movie[field] for field in fields}
+
+
+def iter_records(movies, fields=None):
+    """
+    Yield one plain dict per movie, holding only the requested fields.
+
+    Args:
+        movies (iterable): Movie records, e.g. MovieManager.fetch_all_details().values()
+        fields (list): Fields to include (default: all of MOVIE_FIELDS)
+
+    Yields:
+        dict: The projected record
+    """
+    fields = fields or MOVIE_FIELDS
+    for movie in movies:
+        yield project_record(movie, fields)
+
+
+class MovieExporter:
+    """
+    Streams movie records to a JSONL, CSV, Parquet or Arrow file.
+
+    Records are written as they are passed to write(), so the whole dataset
+    is never held in memory. Parquet and Arrow need pyarrow and are written
+    in row batches.
+    """
+
+    def __init__(self, filename, format=None, fields=None, batch_size=1000):
+        """
+        Args:
+            filename (str): Path of the file to write
+            format (str): One of EXPORT_FORMATS (default: from the file extension)
+            fields (list): Fields to export, in column order (default: all)
+            batch_size (int): Rows per batch for the columnar formats
+        """
+        self.filename = filename
+        self.format = format or os.path.splitext(filename)[1].lstrip(".").lower()
+        self.fields = list(fields or MOVIE_FIELDS)
+        self.batch_size = batch_size
+        self.count = 0
+
+        if self.format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {self.format}")
+        unknown = [f for f in self.fields if f not in MOVIE_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown export fields: {', '.join(unknown)}")
+        if self.format in ("parquet", "arrow") and pyarrow is None:
+            raise ImportError(f"Exporting to {self.format} requires pyarrow (pip install pyarrow)")
+
+        self._batch = []
+        self._writer = None
+        self._file = None
+
+        if self.format == "jsonl":
+            self._file = open(filename, 'w', encoding='utf-8')
+        elif self.format == "csv":
+            self._file = open(filename, 'w', encoding='utf-8', newline='')
+            self._writer = csv.DictWriter(self._file, fieldnames=self.fields)
+            self._writer.writeheader()
+        else:
+            self._schema = pyarrow.schema(
+                [(f, _ARROW_TYPES.get(f, pyarrow.string)()) for f in self.fields])
+            if self.format == "parquet":
+                self._writer = pyarrow.parquet.ParquetWriter(filename, self._schema)
+            else:
+                self._file = pyarrow.OSFile(filename, 'wb')
+                self._writer = pyarrow.ipc.new_stream(self._file, self._schema)
+
+    def write(self, movie):
+        """
+        Write a single movie.
+
+        Args:
+            movie (Movie): The movie record to write
+        """
+        record = project_record(movie, self.fields)
+
+        if self.format == "jsonl":
+            self._file.write(json.dumps(record, ensure_ascii=False))
+            self._file.write("\n")
+        elif self.format == "csv":
+            self._writer.writerow(record)
+        else:
+            self._batch.append(record)
+            if len(self._batch) >= self.batch_size:
+                self._flush_batch()
+
+        self.count += 1
+
+    def _flush_batch(self):
+        """Write the pending rows of a columnar export."""
+        if not self._batch:
+            return
+        table = pyarrow.Table.from_pylist(self._batch, schema=self._schema)
+        self._writer.write_table(table)
+        self._batch = []
+
+    def close(self):
+        """Flush any pending rows and close the file."""
+        if self.format in ("parquet", "arrow"):
+            self._flush_batch()
+            self._writer.close()
+        if self._file is not None:
+            self._file.close()
+        print(f"Exported {self.count} movies to {self.filename}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def export_movies(movies, filename, format=None, fields=None):
+    """
+    Export movies to a file in one streaming pass.
+
+    Args:
+        movies (iterable): Movie records, e.g. MovieManager.fetch_all_details().values()
+        filename (str): Path of the file to write
+        format (str): One of EXPORT_FORMATS (default: from the file extension)
+        fields (list): Fields to export, in column order (default: all)
+
+    Returns:
+        int: Number of movies written
+    """
+    with MovieExporter(filename, format=format, fields=fields) as exporter:
+        for movie in movies:
+            exporter.write(movie)
+    return exporter.count
@@ -1,19 +1,198 @@
-import requests
 from bs4 import BeautifulSoup
 import re
 import json
 import os
+import threading
 import time
+from movie import Movie, RankedView
+from search_index import SearchIndex, index_filename_for
+from retry import CircuitBreaker, RequestStats, get_with_retry
+from pipeline import FetchParsePipeline
+from export import MovieExporter
+from singleflight import SingleFlight
+
+
+# Charts MovieManager knows how to ingest: name -> (label, URL)
+CHARTS = {
+    "top": ("Top 250 Movies", "https://www.imdb.com/chart/top/"),
+    "popular": ("Most Popular Movies", "https://www.imdb.com/chart/moviemeter/"),
+    "top_tv": ("Top 250 TV Shows", "https://www.imdb.com/chart/toptv/"),
+    "popular_tv": ("Most Popular TV Shows", "https://www.imdb.com/chart/tvmeter/"),
+}
+
+# IMDb's own genre top lists require 25,000 votes; without a floor the
+# search is led by barely-rated titles with perfect scores
+CHARTS.update({
+    f"genre:{genre}": (
+        f"Top {genre.title()} Movies",
+        f"https://www.imdb.com/search/title/?title_type=feature&genres={genre}"
+        "&num_votes=25000,&sort=user_rating,desc"
+    )
+    for genre in ("action", "comedy", "drama", "horror", "sci-fi", "animation")
+})
+
+
+def parse_title_page(html, movie_id):
+    """
+    Parse the fields MovieManager stores from a movie's title page.
+
+    Kept at module level, free of any MovieManager state, so it can run in a
+    worker process.
+
+    Args:
+        html (bytes or str): Raw title page
+        movie_id (str): IMDb ID of the page
+
+    Returns:
+        dict: Movie details with "N/A" for anything not found
+    """
+    movie_soup = BeautifulSoup(html, 'html.parser')
+
+    movie_details = {
+        "imdb_id": movie_id,
+        "url": f"https://www.imdb.com/title/{movie_id}/",
+        "year": "N/A",
+        "director": "N/A",
+        "rating": "N/A",
+        "genre": "N/A",
+        "description": "N/A",
+        "poster_url": None
+    }
+
+    year_element = movie_soup.select_one("[data-testid='title-details-releasedate']")
+    if year_element:
+        year_match = re.search(r'\d{4}', year_element.text)
+        if year_match:
+            movie_details["year"] = year_match.group(0)
+
+    director_element = movie_soup.select_one(
+        "[data-testid='title-pc-principal-credit']:has(a[href*='director'])")
+    if director_element:
+        director_name = director_element.select_one("a")
+        if director_name:
+            movie_details["director"] = director_name.text.strip()
+
+    rating_element = movie_soup.select_one("[data-testid='hero-rating-bar__aggregate-rating__score']")
+    if rating_element:
+        rating_text = rating_element.text.strip()
+        movie_details["rating"] = rating_text
+
+    genre_element = movie_soup.select_one("[data-testid='genres']")
+    if genre_element:
+        genres = genre_element.select("a")
+        if genres:
+            movie_details["genre"] = ", ".join([g.text.strip() for g in genres])
+
+    plot_element = movie_soup.select_one("[data-testid='plot']")
+    if plot_element:
+        movie_details["description"] = plot_element.text.strip()
+
+    poster_element = movie_soup.select_one("[data-testid='hero-media__poster'] img")
+    if poster_element and 'src' in poster_element.attrs:
+        movie_details["poster_url"] = poster_element['src']
+
+    return movie_details
+
+
+def parse_storyline_page(html, movie_id):
+    """
+    Parse the storyline from a movie's plot summary page.
+
+    Args:
+        html (bytes or str): Raw plot summary page
+        movie_id (str): IMDb ID of the page
+
+    Returns:
+        str: Full storyline text
+    """
+    plot_soup = BeautifulSoup(html, 'html.parser')
+
+    storyline_elements = plot_soup.select(".ipc-html-content-inner-div")
+
+    if len(storyline_elements) >= 2:
+        return storyline_elements[2].text.strip()
+
+    raise Exception(f"Could not find storyline for movie ID: {movie_id}")
+
 
 class MovieManager:
     def __init__(self):
         """Initialize the MovieManager with empty movie collection."""
+        # Movies are stored once by IMDb ID so that fetched details and caches
+        # keyed on the ID survive re-ranking; each chart's order is a list of
+        # IDs in self.rankings, and self.ranking is the active chart's order
         self.movies = {}
+        self.rankings = {}
+        self.active_chart = "top"
+        self._title_index = {}
+        self.search_index = SearchIndex()
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             "Accept-Language": "en-US,en;q=0.9",
         }
-        self.base_url = "https://www.imdb.com/chart/top/"
+        # Shared by every fetch so throttling pauses all of them at once
+        self.circuit_breaker = CircuitBreaker()
+        self.request_stats = RequestStats()
+        # Lets the UI, prefetch and scheduler threads share one fetch per movie
+        self.single_flight = SingleFlight()
+        # Guards self.movies and self.rankings while the Tk thread changes them
+        # and the scheduler thread saves them
+        self._lock = threading.RLock()
+
+    @property
+    def ranking(self):
+        """IMDb IDs of the active chart, in rank order."""
+        return self.rankings.get(self.active_chart, [])
+
+    @property
+    def base_url(self):
+        """URL of the active chart."""
+        return CHARTS[self.active_chart][1]
+
+    def set_active_chart(self, chart):
+        """
+        Switch the chart that ranks, lists and lookups use. No data is fetched.
+
+        Args:
+            chart (str): A key of CHARTS
+        """
+        if chart not in CHARTS:
+            raise ValueError(f"Unknown chart: {chart}")
+        with self._lock:
+            self.active_chart = chart
+            self._rebuild_indexes()
+
+    def get_stats(self):
+        """
+        Return fetch statistics.
+
+        Returns:
+            dict: Movie count, requests made, retries and throttle pauses
+        """
+        return {
+            "movies": len(self.movies),
+            "requests": self.request_stats["requests"],
+            "retries": self.request_stats["retries"],
+            "throttle_pauses": self.circuit_breaker.trips,
+            "duplicate_fetches_avoided": self.single_flight.shared,
+        }
+
+    def _get(self, url, stage, max_retries=3, retry_delay=1.0):
+        """
+        GET an IMDb page, retrying just this request on transient failures.
+
+        Args:
+            url (str): URL to fetch
+            stage (str): Name of the fetch stage, used in log messages
+            max_retries (int): Maximum number of attempts
+            retry_delay (float): Backoff delay ceiling for the first retry
+
+        Returns:
+            requests.Response: The successful response
+        """
+        return get_with_retry(url, self.headers, stage, breaker=self.circuit_breaker,
+                              max_retries=max_retries, base_delay=retry_delay,
+                              stats=self.request_stats)
 
     def fetch_top_movies(self, limit=10, force_refresh=False):
         """
@@ -21,87 +200,333 @@ class MovieManager:
 
         Args:
             limit (int): Number of top movies to fetch (default: 10)
-            force_refresh (bool): Whether to refresh existing movies
+            force_refresh (bool): Whether to re-read the chart; existing entries
+                are matched by IMDb ID and kept instead of being wiped
 
         Returns:
-            dict: Dictionary of movies indexed by rank
+            RankedView: Read-only mapping of movies indexed by rank
         """
 
         # If movies are already fetched and no forced refresh, return subset
-        if self.movies and not force_refresh:
-            return {k: v for k, v in self.movies.items() if k <= limit}
+        if self.ranking and not force_refresh:
+            return self._ranked_subset(limit)
 
         try:
+            entries = self._fetch_chart_entries(limit)
+            self._merge_chart_entries(entries)
 
-            # Send HTTP GET request to IMDb top movies page
-            response = requests.get(self.base_url, headers=self.headers)
-            # Raise an error for bad HTTP responses
-            response.raise_for_status()
+            if len(self.ranking) < limit:
+                print(f"Warning: Only found {len(self.ranking)} movies, expected {limit}")
 
-            soup = BeautifulSoup(response.text, 'html.parser')
-            movie_containers = soup.select(".ipc-metadata-list-summary-item")
-
-            if not movie_containers:
-                movie_containers = soup.select(".ipc-metadata-list-item")
-            if not movie_containers:
-                movie_containers = soup.select("[data-testid='chart-layout-main-column'] .ipc-metadata-list-item")
-            if not movie_containers:
-                movie_containers = soup.select(".ipc-title-link-wrapper")
-
-            # Raise exception if no movie elements found on the page
-            if not movie_containers:
-                raise Exception("Failed to find movie elements on the page")
-
-            # Clear existing movies if forced refresh requested
-            if force_refresh:
-                self.movies = {}
-
-            for i, movie in enumerate(movie_containers[:limit]):
-                rank = i + 1
-                title_element = movie.select_one(".ipc-title__text")
-                if not title_element:
-                    title_element = movie.select_one(".ipc-metadata-list-item__label")
-                if not title_element:
-                    title_element = movie.select_one("a")
-
-                if title_element:
-                    title = title_element.text.strip()
-                    if '. ' in title and title[0].isdigit():
-                        title = title.split('. ', 1)[1]
-
-                    self.movies[rank] = {
-                        "rank": rank,
-                        "title": title,
-                        "details_fetched": False
-                    }
-
-            if len(self.movies) < limit:
-                print(f"Warning: Only found {len(self.movies)} movies, expected {limit}")
-
-            return {k: v for k, v in self.movies.items() if k <= limit}
+            return self._ranked_subset(limit)
 
         except Exception as e:
             print(f"Error fetching top movies: {e}")
             raise
 
-    def get_movie_details(self, movie_title, retry_delay=2, max_retries=3):
+    def _fetch_chart_entries(self, limit, chart=None):
+        """
+        Download a chart page and parse its entries in rank order.
+
+        Args:
+            limit (int): Maximum number of chart entries to return
+            chart (str): A key of CHARTS (default: the active chart)
+
+        Returns:
+            list: Dicts with rank, title, imdb_id and chart rating
+        """
+        # Send HTTP GET request to IMDb top movies page
+        response = self._get(CHARTS[chart or self.active_chart][1], "Chart")
+
+        soup = BeautifulSoup(response.text, 'html.parser')
+        movie_containers = soup.select(".ipc-metadata-list-summary-item")
+
+        if not movie_containers:
+            movie_containers = soup.select(".ipc-metadata-list-item")
+        if not movie_containers:
+            movie_containers = soup.select("[data-testid='chart-layout-main-column'] .ipc-metadata-list-item")
+        if not movie_containers:
+            movie_containers = soup.select(".ipc-title-link-wrapper")
+
+        # Raise exception if no movie elements found on the page
+        if not movie_containers:
+            raise Exception("Failed to find movie elements on the page")
+
+        entries = []
+        for i, movie in enumerate(movie_containers[:limit]):
+            rank = i + 1
+            title_element = movie.select_one(".ipc-title__text")
+            if not title_element:
+                title_element = movie.select_one(".ipc-metadata-list-item__label")
+            if not title_element:
+                title_element = movie.select_one("a")
+
+            if not title_element:
+                continue
+
+            title = title_element.text.strip()
+            if '. ' in title and title[0].isdigit():
+                title = title.split('. ', 1)[1]
+
+            # The chart links every entry to its title page, which gives us a
+            # stable ID to match entries across refreshes
+            link = movie if movie.name == "a" else movie.select_one("a[href*='/title/tt']")
+            imdb_id = None
+            if link and link.get("href"):
+                id_match = re.search(r'/title/(tt\d+)', link["href"])
+                if id_match:
+                    imdb_id = id_match.group(1)
+
+            if not imdb_id:
+                print(f"Warning: Skipping chart entry without IMDb ID: {title}")
+                continue
+
+            rating = None
+            rating_element = movie.select_one(".ipc-rating-star--rating")
+            if rating_element:
+                rating = rating_element.text.strip()
+
+            entries.append({
+                "rank": rank,
+                "title": title,
+                "imdb_id": imdb_id,
+                "rating": rating
+            })
+
+        return entries
+
+    def _merge_chart_entries(self, entries, max_age=None, chart=None):
+        """
+        Merge freshly parsed chart entries into the movies dictionary.
+
+        Entries already known by IMDb ID, from this or any other chart, keep
+        their fetched details and are only re-ranked. Details are marked for
+        refetching only for new entries, or for entries older than max_age
+        seconds. Movies no longer on any chart are dropped.
+
+        Args:
+            entries (list): Chart entries from _fetch_chart_entries
+            max_age (float): Staleness age in seconds (default: never stale)
+            chart (str): A key of CHARTS (default: the active chart)
+
+        Returns:
+            dict: Report with added, removed, moved, rating_changed and stale entries
+        """
+        with self._lock:
+            chart = chart or self.active_chart
+            old_ranks = {imdb_id: i + 1 for i, imdb_id in enumerate(self.rankings.get(chart, []))}
+            now = time.time()
+            report = {"added": [], "removed": [], "moved": [], "rating_changed": [], "stale": [], "unchanged": 0}
+
+            ranking = []
+            for entry in entries:
+                rank = entry["rank"]
+                imdb_id = entry["imdb_id"]
+                movie = self.movies.get(imdb_id)
+                ranking.append(imdb_id)
+
+                if movie is None:
+                    movie = Movie(imdb_id, entry["title"], rank=rank, rating=entry["rating"])
+                    self.movies[imdb_id] = movie
+                    self.search_index.add(movie)
+                    report["added"].append(entry["title"])
+                    continue
+
+                changed = False
+                old_rank = old_ranks.pop(imdb_id, None)
+                if old_rank is None:
+                    # Already stored from another chart, but new to this one
+                    report["added"].append(entry["title"])
+                    changed = True
+                elif old_rank != rank:
+                    report["moved"].append((entry["title"], old_rank, rank))
+                    changed = True
+
+                if entry["rating"] and movie.get("rating") not in (None, "N/A", entry["rating"]):
+                    report["rating_changed"].append((entry["title"], movie["rating"], entry["rating"]))
+                    changed = True
+                if entry["rating"]:
+                    movie["rating"] = entry["rating"]
+
+                if (max_age is not None and movie.get("details_fetched", False)
+                        and now - movie.get("fetched_at", 0) > max_age):
+                    movie["details_fetched"] = False
+                    report["stale"].append(entry["title"])
+                    changed = True
+
+                if not changed:
+                    report["unchanged"] += 1
+
+            report["removed"] = [self.movies[i]["title"] for i in old_ranks if i in self.movies]
+            self.rankings[chart] = ranking
+
+            # A movie dropped from this chart may still be on another one
+            still_ranked = {i for ids in self.rankings.values() for i in ids}
+            for imdb_id in old_ranks:
+                if imdb_id not in still_ranked:
+                    self.movies.pop(imdb_id, None)
+                    self.search_index.remove(imdb_id)
+
+            self._rebuild_indexes()
+            return report
+
+    def _rebuild_indexes(self):
+        """Rebuild the rank fields and title lookup from the active chart."""
+        self._title_index = {}
+        for movie in self.movies.values():
+            movie["rank"] = None
+        for i, imdb_id in enumerate(self.ranking):
+            movie = self.movies[imdb_id]
+            movie["rank"] = i + 1
+            # Keep the best ranked movie when two titles collide
+            self._title_index.setdefault(movie["title"].casefold(), imdb_id)
+        for imdb_id, movie in self.movies.items():
+            self._title_index.setdefault(movie["title"].casefold(), imdb_id)
+
+    def _ranked_subset(self, limit=None):
+        """
+        Return movies in chart order, keyed by rank.
+
+        Args:
+            limit (int): Highest rank to include (default: all)
+
+        Returns:
+            RankedView: Read-only mapping of movies indexed by rank
+        """
+        return RankedView(self.movies, self.ranking, limit)
+
+    def get_movie(self, imdb_id):
+        """Return the stored movie with the given IMDb ID, or None."""
+        return self.movies.get(imdb_id)
+
+    def get_movie_by_rank(self, rank):
+        """Return the movie currently at the given rank, or None."""
+        if 1 <= rank <= len(self.ranking):
+            return self.movies[self.ranking[rank - 1]]
+        return None
+
+    def get_movie_by_title(self, title):
+        """Return the best ranked movie with the given title, or None."""
+        imdb_id = self._title_index.get(title.casefold())
+        return self.movies.get(imdb_id) if imdb_id else None
+
+    def search(self, query, limit=20):
+        """
+        Search titles, directors, genres, descriptions and storylines.
+
+        Args:
+            query (str): Free-text query; the last word matches as a prefix
+            limit (int): Maximum number of results
+
+        Returns:
+            list: Matching movies, best match first
+        """
+        return [self.movies[i] for i in self.search_index.search(query, limit) if i in self.movies]
+
+    def refresh_top_movies(self, limit=10, max_age=7 * 24 * 3600, fetch_details=True):
+        """
+        Incrementally refresh the chart and fetch details only where needed.
+
+        Args:
+            limit (int): Number of top movies to track (default: 10)
+            max_age (float): Seconds after which fetched details are refetched
+            fetch_details (bool): Whether to fetch details for new/stale entries
+
+        Returns:
+            dict: Report of what changed, including the titles refetched
+        """
+        entries = self._fetch_chart_entries(limit)
+        report = self._merge_chart_entries(entries, max_age=max_age)
+
+        pending = [self.movies[i] for i in self.ranking if not self.movies[i].get("details_fetched", False)]
+        report["refetched"] = []
+        if fetch_details and pending:
+            self.fetch_all_details(max_rank=limit)
+            report["refetched"] = [m["title"] for m in pending if m.get("details_fetched", False)]
+
+        print(f"Refresh complete: {len(report['added'])} added, {len(report['removed'])} removed, "
+              f"{len(report['moved'])} moved, {len(report['rating_changed'])} rating changes, "
+              f"{len(report['stale'])} stale, {len(report['refetched'])} refetched")
+        return report
+
+    def fetch_charts(self, charts, limit=10, max_age=None, fetch_details=True, parse_workers=None,
+                     network_workers=4):
+        """
+        Ingest several charts in one run, fetching each movie's details once.
+
+        Args:
+            charts (list): Keys of CHARTS to ingest
+            limit (int): Number of entries to keep per chart (default: 10)
+            max_age (float): Seconds after which fetched details are refetched
+            fetch_details (bool): Whether to fetch details for new/stale entries
+            parse_workers (int): When set, download pages on network_workers
+                threads and parse them on this many processes
+            network_workers (int): Download threads for the parallel pipeline
+
+        Returns:
+            dict: Refresh report per chart
+        """
+        reports = {}
+        for chart in charts:
+            if chart not in CHARTS:
+                raise ValueError(f"Unknown chart: {chart}")
+            try:
+                entries = self._fetch_chart_entries(limit, chart)
+                reports[chart] = self._merge_chart_entries(entries, max_age=max_age, chart=chart)
+            except Exception as e:
+                print(f"Error fetching chart {chart}: {e}")
+
+        # A title on several charts is one entry in self.movies, so it only
+        # shows up here (and gets fetched) once
+        pending = {}
+        for chart in reports:
+            for imdb_id in self.rankings[chart]:
+                if not self.movies[imdb_id].get("details_fetched", False):
+                    pending[imdb_id] = self.movies[imdb_id]
+
+        if fetch_details and pending:
+            if parse_workers:
+                self._fetch_details_pipelined(list(pending.values()), parse_workers, network_workers)
+            else:
+                for imdb_id, movie in pending.items():
+                    try:
+                        print(f"Fetching details for {movie['title']}")
+                        self.fetch_movie_details_by_id(imdb_id)
+                        time.sleep(1)
+                    except Exception as e:
+                        print(f"Error fetching details for {movie['title']}: {e}")
+
+        for chart, report in reports.items():
+            print(f"{CHARTS[chart][0]}: {len(report['added'])} added, {len(report['removed'])} removed, "
+                  f"{len(report['moved'])} moved")
+        print(f"Fetched details for {len(pending) if fetch_details else 0} unique movies "
+              f"across {len(reports)} charts")
+        return reports
+
+    def get_movie_details(self, movie_title, retry_delay=1.0, max_retries=3, imdb_id=None,
+                          include_storyline=True):
         """
         Fetch detailed information for a movie by title.
 
         Args:
             movie_title (str): The title of the movie
-            retry_delay (int): Seconds to wait between retries
-            max_retries (int): Maximum number of retry attempts
+            retry_delay (float): Backoff delay ceiling for a stage's first retry
+            max_retries (int): Maximum number of attempts per request
+            imdb_id (str): Known IMDb ID; skips the title search when given
+            include_storyline (bool): Whether to also fetch the plot summary page;
+                when False the result has no storyline key
 
         Returns:
             dict: Movie details dictionary
         """
-        for attempt in range(max_retries):
-            try:
+        # Each request retries on its own, so a transient failure in one stage
+        # does not re-run the stages that already succeeded
+        try:
+            movie_id = imdb_id
+            if not movie_id:
                 #Search movie on IMDb using query parameterized URL
                 search_url = f"https://www.imdb.com/find/?q={movie_title.replace(' ', '+')}"
-                search_response = requests.get(search_url, headers=self.headers)
-                search_response.raise_for_status()
+                search_response = self._get(search_url, "Search", max_retries, retry_delay)
                 search_soup = BeautifulSoup(search_response.text, 'html.parser')
 
                 movie_link = search_soup.select_one("a[href*='/title/tt']")
@@ -114,98 +539,49 @@ class MovieManager:
 
                 movie_id = movie_id_match.group(1)
 
-                #Fetch movie details page using movie ID and scrape key data points
-                movie_url = f"https://www.imdb.com/title/{movie_id}/"
-                movie_response = requests.get(movie_url, headers=self.headers)
-                movie_response.raise_for_status()
-                movie_soup = BeautifulSoup(movie_response.text, 'html.parser')
-
-                movie_details = {
-                    "title": movie_title,
-                    "imdb_id": movie_id,
-                    "url": movie_url,
-                    "year": "N/A",
-                    "director": "N/A",
-                    "rating": "N/A",
-                    "genre": "N/A",
-                    "description": "N/A",
-                    "storyline": "N/A",
-                    "poster_url": None,
-                    "details_fetched": True
-                }
-
-                year_element = movie_soup.select_one("[data-testid='title-details-releasedate']")
-                if year_element:
-                    year_match = re.search(r'\d{4}', year_element.text)
-                    if year_match:
-                        movie_details["year"] = year_match.group(0)
-
-                director_element = movie_soup.select_one(
-                    "[data-testid='title-pc-principal-credit']:has(a[href*='director'])")
-                if director_element:
-                    director_name = director_element.select_one("a")
-                    if director_name:
-                        movie_details["director"] = director_name.text.strip()
-
-                rating_element = movie_soup.select_one("[data-testid='hero-rating-bar__aggregate-rating__score']")
-                if rating_element:
-                    rating_text = rating_element.text.strip()
-                    movie_details["rating"] = rating_text
-
-                genre_element = movie_soup.select_one("[data-testid='genres']")
-                if genre_element:
-                    genres = genre_element.select("a")
-                    if genres:
-                        movie_details["genre"] = ", ".join([g.text.strip() for g in genres])
-
-                plot_element = movie_soup.select_one("[data-testid='plot']")
-                if plot_element:
-                    movie_details["description"] = plot_element.text.strip()
-
-                poster_element = movie_soup.select_one("[data-testid='hero-media__poster'] img")
-                if poster_element and 'src' in poster_element.attrs:
-                    movie_details["poster_url"] = poster_element['src']
-
-                #Fallback to plot description if storyline extraction fails
-                try:
-                    movie_details["storyline"] = self._get_movie_storyline(movie_id)
-                except Exception as e:
-                    print(f"Could not fetch storyline, using plot summary: {e}")
-                    movie_details["storyline"] = movie_details["description"]
+            #Fetch movie details page using movie ID and scrape key data points
+            movie_url = f"https://www.imdb.com/title/{movie_id}/"
+            movie_response = self._get(movie_url, "Title page", max_retries, retry_delay)
+            movie_details = parse_title_page(movie_response.content, movie_id)
+            movie_details["title"] = movie_title
+            movie_details["details_fetched"] = True
+            movie_details["fetched_at"] = time.time()
 
-                return movie_details
+            if include_storyline:
+                movie_details["storyline"] = self._get_storyline_or_description(
+                    movie_id, movie_details["description"], max_retries, retry_delay)
+                movie_details["storyline_fetched"] = True
 
-            except Exception as e:
-                # Print retry info and raise exception on last attempt
-                print(f"Attempt {attempt + 1}/{max_retries} failed: {e}")
-                if attempt < max_retries - 1:
-                    print(f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                else:
-                    print(f"Failed to fetch details after {max_retries} attempts")
-                    raise Exception(f"Failed to get details for {movie_title}: {e}")
+            return movie_details
+
+        except Exception as e:
+            print(f"Failed to fetch details for {movie_title}: {e}")
+            raise Exception(f"Failed to get details for {movie_title}: {e}")
 
-    def _get_movie_storyline(self, movie_id):
+    def _get_storyline_or_description(self, movie_id, description, max_retries=3, retry_delay=1.0):
+        """Fetch a movie's storyline, falling back to its plot description."""
+        #Fallback to plot description if storyline extraction fails
+        try:
+            return self._get_movie_storyline(movie_id, max_retries, retry_delay)
+        except Exception as e:
+            print(f"Could not fetch storyline, using plot summary: {e}")
+            return description
+
+    def _get_movie_storyline(self, movie_id, max_retries=3, retry_delay=1.0):
         """
         Helper method to get a movie's storyline using its IMDb ID.
 
         Args:
             movie_id (str): IMDb ID (e.g., 'tt0111161')
+            max_retries (int): Maximum number of attempts for the request
+            retry_delay (float): Backoff delay ceiling for the first retry
 
         Returns:
             str: Full storyline text
         """
         plot_url = f"https://www.imdb.com/title/{movie_id}/plotsummary/"
-        plot_response = requests.get(plot_url, headers=self.headers)
-        plot_response.raise_for_status()
-        plot_soup = BeautifulSoup(plot_response.text, 'html.parser')
-
-        storyline_elements = plot_soup.select(".ipc-html-content-inner-div")
-
-        if len(storyline_elements) >= 2:
-            return storyline_elements[2].text.strip()
-
-        raise Exception(f"Could not find storyline for movie ID: {movie_id}")
+        plot_response = self._get(plot_url, "Plot summary", max_retries, retry_delay)
+        return parse_storyline_page(plot_response.content, movie_id)
 
     def fetch_movie_details_by_rank(self, rank):
         """
@@ -215,52 +591,256 @@ class MovieManager:
             rank (int): The rank of the movie to fetch details for
 
         Returns:
-            dict: Updated movie details dictionary
+            Movie: Updated movie record
         """
-        if rank not in self.movies:
-            self.fetch_top_movies(limit=rank)
+        if rank > len(self.ranking):
+            self.fetch_top_movies(limit=rank, force_refresh=bool(self.ranking))
 
-        if rank not in self.movies:
+        movie = self.get_movie_by_rank(rank)
+        if movie is None:
             raise Exception(f"No movie found with rank {rank}")
 
-        movie = self.movies[rank]
+        return self.fetch_movie_details_by_id(movie["imdb_id"])
+
+    def fetch_movie_details_by_id(self, imdb_id):
+        """
+        Fetch detailed information for a stored movie by its IMDb ID.
+
+        Args:
+            imdb_id (str): IMDb ID (e.g., 'tt0111161')
+
+        Returns:
+            Movie: Updated movie record
+        """
+        movie = self.movies.get(imdb_id)
+        if movie is None:
+            raise Exception(f"No movie found with IMDb ID {imdb_id}")
+
+        if movie.get("details_fetched", False):
+            return movie
+
+        return self.single_flight.do(("details", imdb_id), self._fetch_details_once, movie)
 
+    def _fetch_details_once(self, movie):
+        """Fetch and store a movie's details unless another caller just did."""
         if movie.get("details_fetched", False):
             return movie
 
-        details = self.get_movie_details(movie["title"])
-        details["rank"] = rank
-        self.movies[rank] = details
+        imdb_id = movie["imdb_id"]
+        # The storyline is a whole extra page per movie and is only needed once
+        # a movie is opened, so fetch_storyline resolves it on demand
+        details = self.get_movie_details(movie["title"], imdb_id=imdb_id, include_storyline=False)
+        details.pop("imdb_id", None)
+        details.pop("rank", None)
+        # Update in place so references held by callers stay current
+        movie.update(details)
+        self.search_index.add(movie)
+
+        return movie
+
+    def revalidate_movie(self, imdb_id):
+        """
+        Refetch a stored movie's title page and update it in place.
+
+        Args:
+            imdb_id (str): IMDb ID (e.g., 'tt0111161')
+
+        Returns:
+            bool: True if any displayed field changed
+        """
+        movie = self.movies.get(imdb_id)
+        if movie is None:
+            return False
+
+        # A movie without details is a plain detail fetch, and must share its
+        # key with the UI and image worker so the page is downloaded once
+        if not movie.get("details_fetched", False):
+            self.fetch_movie_details_by_id(imdb_id)
+            return True
+
+        return self.single_flight.do(("revalidate", imdb_id), self._revalidate_once, movie)
+
+    def _revalidate_once(self, movie):
+        """Refetch a movie's title page and report whether it changed."""
+        imdb_id = movie["imdb_id"]
+        details = self.get_movie_details(movie["title"], imdb_id=imdb_id, include_storyline=False)
+        details.pop("imdb_id", None)
+        details.pop("rank", None)
+
+        changed = not movie.get("details_fetched", False) or any(
+            movie.get(key) != value for key, value in details.items()
+            if key not in ("details_fetched", "fetched_at", "url")
+        )
+        movie.update(details)
+        if changed:
+            self.search_index.add(movie)
+        return changed
+
+    def fetch_storyline(self, imdb_id):
+        """
+        Return a movie's storyline, fetching and caching it on first access.
+
+        Args:
+            imdb_id (str): IMDb ID (e.g., 'tt0111161')
+
+        Returns:
+            str: Storyline text, or the plot description if none was found
+        """
+        movie = self.fetch_movie_details_by_id(imdb_id)
+
+        if not movie.get("storyline_fetched", False):
+            self.single_flight.do(("storyline", imdb_id), self._fetch_storyline_once, movie)
 
-        return details
+        return movie.get("storyline")
 
-    def fetch_all_details(self, max_rank=None):
+    def _fetch_storyline_once(self, movie):
+        """Fetch and store a movie's storyline unless another caller just did."""
+        if movie.get("storyline_fetched", False):
+            return
+        movie["storyline"] = self._get_storyline_or_description(movie["imdb_id"], movie.get("description"))
+        movie["storyline_fetched"] = True
+        self.search_index.add(movie)
+
+    def prefetch_storylines(self, imdb_ids):
+        """
+        Fetch storylines for the given movies ahead of them being opened.
+
+        Args:
+            imdb_ids (iterable): IMDb IDs, in the order to fetch them
+        """
+        for imdb_id in imdb_ids:
+            movie = self.movies.get(imdb_id)
+            if movie is None or movie.get("storyline_fetched", False):
+                continue
+            try:
+                self.fetch_storyline(imdb_id)
+            except Exception as e:
+                print(f"Error prefetching storyline for {imdb_id}: {e}")
+
+    def fetch_all_details(self, max_rank=None, parse_workers=None, network_workers=4, exporter=None):
         """
         Fetch details for all movies up to max_rank.
 
         Args:
             max_rank (int): Maximum rank to fetch details for (default: all)
+            parse_workers (int): When set, download pages on network_workers
+                threads and parse them on this many processes
+            network_workers (int): Download threads for the parallel pipeline
+            exporter (MovieExporter): When set, every movie is written to it as
+                soon as its details are available
 
         Returns:
-            dict: Updated dictionary of movies
+            RankedView: Read-only mapping of movies indexed by rank
         """
-        if not self.movies:
+        if not self.ranking:
             self.fetch_top_movies(limit=max_rank or 10)
 
-        ranks = sorted(self.movies.keys())
-        if max_rank:
-            ranks = [r for r in ranks if r <= max_rank]
+        ranked = self._ranked_subset(max_rank)
 
-        for rank in ranks:
-            if not self.movies[rank].get("details_fetched", False):
+        if parse_workers:
+            pending = []
+            for movie in ranked.values():
+                if not movie.get("details_fetched", False):
+                    pending.append(movie)
+                elif exporter:
+                    exporter.write(movie)
+            self._fetch_details_pipelined(pending, parse_workers, network_workers, exporter)
+            return ranked
+
+        for rank, movie in ranked.items():
+            if not movie.get("details_fetched", False):
                 try:
-                    print(f"Fetching details for rank {rank}: {self.movies[rank]['title']}")
-                    self.fetch_movie_details_by_rank(rank)
+                    print(f"Fetching details for rank {rank}: {movie['title']}")
+                    self.fetch_movie_details_by_id(movie["imdb_id"])
                     time.sleep(1)
                 except Exception as e:
                     print(f"Error fetching details for rank {rank}: {e}")
+            if exporter:
+                exporter.write(movie)
+
+        return ranked
+
+    def _fetch_details_pipelined(self, movies, parse_workers, network_workers, exporter=None):
+        """
+        Fetch title pages on threads and parse them on a process pool.
 
-        return {k: v for k, v in self.movies.items() if k in ranks}
+        Args:
+            movies (list): Movie records to fetch details for
+            parse_workers (int): Number of parser processes
+            network_workers (int): Number of download threads
+            exporter (MovieExporter): Optional exporter to write each movie to
+        """
+        # Claim each movie's detail key so callers of fetch_movie_details_by_id
+        # wait for the pipeline; movies someone else is fetching are skipped
+        # here and picked up once that fetch finishes
+        claimed = {}
+        in_flight = []
+        for movie in movies:
+            if self.single_flight.claim(("details", movie["imdb_id"])):
+                claimed[movie["imdb_id"]] = movie
+            else:
+                in_flight.append(movie)
+
+        pipeline = FetchParsePipeline(
+            lambda url: self._get(url, "Title page").content,
+            parse_title_page,
+            network_workers=network_workers,
+            parse_workers=parse_workers
+        )
+        jobs = [(imdb_id, f"https://www.imdb.com/title/{imdb_id}/") for imdb_id in claimed]
+
+        try:
+            for imdb_id, details, error in pipeline.run(jobs):
+                movie = claimed.pop(imdb_id)
+                if error is not None:
+                    print(f"Error fetching details for {movie['title']}: {error}")
+                else:
+                    details.pop("imdb_id", None)
+                    details["details_fetched"] = True
+                    details["fetched_at"] = time.time()
+                    movie.update(details)
+                    self.search_index.add(movie)
+                    print(f"Fetched details for rank {movie['rank']}: {movie['title']}")
+                self.single_flight.release(("details", imdb_id), result=movie, error=error)
+
+                if exporter:
+                    exporter.write(movie)
+        finally:
+            for imdb_id in claimed:
+                self.single_flight.release(("details", imdb_id),
+                                           error=Exception(f"Pipelined fetch of {imdb_id} did not finish"))
+
+        for movie in in_flight:
+            try:
+                self.fetch_movie_details_by_id(movie["imdb_id"])
+            except Exception as e:
+                print(f"Error fetching details for {movie['title']}: {e}")
+            if exporter:
+                exporter.write(movie)
+
+    def export(self, filename, format=None, fields=None, max_rank=None, fetch_details=False, **kwargs):
+        """
+        Stream the ranked movies to a JSONL, CSV, Parquet or Arrow file.
+
+        Args:
+            filename (str): Path of the file to write
+            format (str): jsonl, csv, parquet or arrow (default: from the extension)
+            fields (list): Fields to export, e.g. ["rank", "imdb_id", "rating"]
+            max_rank (int): Maximum rank to export (default: all)
+            fetch_details (bool): Fetch missing details first, writing each
+                movie as it is fetched; extra keyword arguments are passed
+                on to fetch_all_details
+
+        Returns:
+            int: Number of movies written
+        """
+        with MovieExporter(filename, format=format, fields=fields) as exporter:
+            if fetch_details:
+                self.fetch_all_details(max_rank=max_rank, exporter=exporter, **kwargs)
+            else:
+                for movie in self._ranked_subset(max_rank).values():
+                    exporter.write(movie)
+        return exporter.count
 
     def save_to_file(self, filename="movie_data.json"):
         """
@@ -273,8 +853,14 @@ class MovieManager:
             bool: True if successful
         """
         try:
+            # Snapshot under the lock; the scheduler saves from its own thread
+            with self._lock:
+                movies = {imdb_id: movie.to_dict() for imdb_id, movie in self.movies.items()}
+                rankings = {chart: list(ids) for chart, ids in self.rankings.items()}
+                data = {"active_chart": self.active_chart, "rankings": rankings, "movies": movies}
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.movies, f, indent=2, ensure_ascii=False)
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            self.search_index.save(index_filename_for(filename))
             print(f"Successfully saved movie data to {filename}")
             return True
         except Exception as e:
@@ -289,7 +875,7 @@ class MovieManager:
             filename (str): Path to the JSON file
 
         Returns:
-            dict: Loaded movie dictionary
+            dict: Loaded movie dictionary indexed by IMDb ID
         """
         try:
             if not os.path.exists(filename):
@@ -297,21 +883,50 @@ class MovieManager:
                 return {}
 
             with open(filename, 'r', encoding='utf-8') as f:
-                self.movies = json.load(f)
-
-            self.movies = {int(k): v for k, v in self.movies.items()}
+                data = json.load(f)
+
+            if "movies" in data:
+                self.movies = {imdb_id: Movie.from_dict(v) for imdb_id, v in data["movies"].items()}
+                # Files from before multi-chart support hold a single "ranking"
+                rankings = data.get("rankings") or {"top": data.get("ranking", [])}
+                self.rankings = {chart: [i for i in ids if i in self.movies]
+                                 for chart, ids in rankings.items() if chart in CHARTS}
+                self.active_chart = data.get("active_chart", "top")
+                if self.active_chart not in CHARTS:
+                    self.active_chart = "top"
+            else:
+                # Older files are keyed by rank; movies saved without an
+                # IMDb ID are dropped and picked up again on the next refresh
+                ranked = sorted((int(k), v) for k, v in data.items() if v.get("imdb_id"))
+                self.movies = {v["imdb_id"]: Movie.from_dict(v) for _, v in ranked}
+                self.rankings = {"top": list(dict.fromkeys(v["imdb_id"] for _, v in ranked))}
+                self.active_chart = "top"
+
+            self._rebuild_indexes()
+            self._load_search_index(index_filename_for(filename))
             print(f"Successfully loaded {len(self.movies)} movies from {filename}")
             return self.movies
         except Exception as e:
             print(f"Error loading movie data: {e}")
             return {}
 
+    def _load_search_index(self, filename):
+        """Load the saved search index and bring it in line with self.movies."""
+        self.search_index = SearchIndex()
+        self.search_index.load(filename)
+
+        for imdb_id in list(self.search_index.doc_terms):
+            if imdb_id not in self.movies:
+                self.search_index.remove(imdb_id)
+        for imdb_id, movie in self.movies.items():
+            if imdb_id not in self.search_index:
+                self.search_index.add(movie)
+
     def fetch_movie_details(self, imdb_id):
         """Fetch detailed information for a specific movie by IMDb ID."""
         try:
             url = f"https://www.imdb.com/title/{imdb_id}/"
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
+            response = self._get(url, "Title page")
             soup = BeautifulSoup(response.text, 'html.parser')
 
             poster_elem = soup.select_one('div[data-testid="hero-media__poster"] img')
@@ -0,0 +1,189 @@
+import io
+import threading
+from collections import OrderedDict
+
+from PIL import Image, ImageTk
+
+
+def make_thumbnail(data, size):
+    """
+    Resize encoded image bytes and re-encode them as PNG.
+
+    Meant to run on a worker thread, so the Tk thread only ever decodes
+    small images.
+
+    Args:
+        data (bytes): Encoded image, e.g. a downloaded poster
+        size (tuple): (width, height) to resize to
+
+    Returns:
+        bytes: PNG encoded thumbnail
+    """
+    img = Image.open(io.BytesIO(data))
+    img = img.resize(size, Image.LANCZOS)
+    out = io.BytesIO()
+    img.save(out, format="PNG")
+    return out.getvalue()
+
+
+class TkImageManager:
+    """
+    Keeps Tk images within a memory budget.
+
+    Encoded bytes are cached per key, and a PhotoImage is decoded from them
+    on demand. Decoded images are evicted least recently used first once
+    they exceed the budget, but never while a widget is showing them, so
+    rows that scroll or filter out of the list give their memory back and
+    are decoded again from the cached bytes when they return. The encoded
+    bytes have their own budget; keys that are neither shown nor decoded
+    are dropped once it is exceeded, and must be downloaded again.
+    """
+
+    def __init__(self, budget_bytes=32 * 1024 * 1024, encoded_budget_bytes=64 * 1024 * 1024):
+        """
+        Args:
+            budget_bytes (int): Memory allowed for decoded images, in bytes
+            encoded_budget_bytes (int): Memory allowed for encoded bytes, in bytes
+        """
+        self.budget_bytes = budget_bytes
+        self.encoded_budget_bytes = encoded_budget_bytes
+        # key -> encoded bytes, least recently used first; put() runs on
+        # worker threads, so access goes through _encoded_lock
+        self._encoded = OrderedDict()
+        self._encoded_bytes = 0
+        self._encoded_lock = threading.Lock()
+        # key -> (PhotoImage, decoded size in bytes), least recently used first
+        self._images = OrderedDict()
+        self._image_bytes = 0
+        # group name -> keys currently shown by widgets in that group
+        self._displayed = {}
+        self.evictions = 0
+
+    def put(self, key, data):
+        """
+        Cache encoded image bytes under a key. Safe to call from any thread.
+
+        Args:
+            key: Hashable key, e.g. an IMDb ID
+            data (bytes): Encoded image
+        """
+        with self._encoded_lock:
+            old = self._encoded.pop(key, None)
+            if old is not None:
+                self._encoded_bytes -= len(old)
+            self._encoded[key] = data
+            self._encoded_bytes += len(data)
+
+    def get_bytes(self, key):
+        """Return the encoded bytes cached under a key, or None."""
+        with self._encoded_lock:
+            return self._encoded.get(key)
+
+    def __contains__(self, key):
+        with self._encoded_lock:
+            return key in self._encoded
+
+    def get(self, key):
+        """
+        Return a PhotoImage for a key, decoding it from cache if needed.
+
+        Must be called on the Tk thread.
+
+        Args:
+            key: Key the bytes were cached under
+
+        Returns:
+            ImageTk.PhotoImage: The image, or None if nothing is cached
+        """
+        if key in self._images:
+            self._images.move_to_end(key)
+            return self._images[key][0]
+
+        with self._encoded_lock:
+            data = self._encoded.get(key)
+            if data is None:
+                return None
+            self._encoded.move_to_end(key)
+
+        pil_image = Image.open(io.BytesIO(data))
+        tk_image = ImageTk.PhotoImage(pil_image)
+        # Tk keeps decoded images as 32-bit pixels
+        size = pil_image.width * pil_image.height * 4
+        self._images[key] = (tk_image, size)
+        self._image_bytes += size
+        self._evict()
+        return tk_image
+
+    def refresh(self, key):
+        """
+        Decode a key again from its cached bytes, e.g. after put() replaced them.
+
+        Must be called on the Tk thread.
+
+        Args:
+            key: Key the bytes were cached under
+
+        Returns:
+            ImageTk.PhotoImage: The new image, or None if nothing is cached
+        """
+        self._release(key)
+        return self.get(key)
+
+    def set_displayed(self, keys, group="default"):
+        """
+        Record which keys a group of widgets is showing, and free the rest.
+
+        Args:
+            keys (iterable): Keys currently on screen for this group
+            group (str): Name of the widget group, e.g. "rows"
+        """
+        self._displayed[group] = set(keys)
+        self._evict()
+
+    def _evict(self):
+        """Drop least recently used images not on screen until within budget."""
+        displayed = set().union(*self._displayed.values())
+        if self._image_bytes > self.budget_bytes:
+            for key in list(self._images):
+                if self._image_bytes <= self.budget_bytes:
+                    break
+                if key not in displayed:
+                    self._release(key)
+                    self.evictions += 1
+
+        with self._encoded_lock:
+            if self._encoded_bytes <= self.encoded_budget_bytes:
+                return
+            for key in list(self._encoded):
+                if self._encoded_bytes <= self.encoded_budget_bytes:
+                    break
+                if key not in displayed and key not in self._images:
+                    self._encoded_bytes -= len(self._encoded.pop(key))
+                    self.evictions += 1
+
+    def _release(self, key):
+        """Drop the decoded image for a key; Tk frees it once unreferenced."""
+        entry = self._images.pop(key, None)
+        if entry is not None:
+            self._image_bytes -= entry[1]
+
+    @property
+    def image_bytes(self):
+        """Bytes held by decoded Tk images."""
+        return self._image_bytes
+
+    @property
+    def encoded_bytes(self):
+        """Bytes held by cached encoded images."""
+        return self._encoded_bytes
+
+    def stats(self):
+        """Return image memory statistics as a dict."""
+        return {
+            "images": len(self._images),
+            "image_bytes": self._image_bytes,
+            "encoded_bytes": self.encoded_bytes,
+            "budget_bytes": self.budget_bytes,
+            "encoded_budget_bytes": self.encoded_budget_bytes,
+            "evictions": self.evictions,
+        }
@@ -2,6 +2,18 @@ import tkinter as tk
 from tkinter import messagebox
 from fetch_movies import MovieManager
 from app_gui import IMDbApp
+from scheduler import RefreshScheduler
+from ui_watchdog import MainLoopWatchdog
+
+# Background revalidation of cached movie data
+REFRESH_INTERVAL = 60 * 60
+REFRESH_MAX_AGE = 24 * 60 * 60
+REFRESH_REQUEST_BUDGET = 20
+
+# Event-loop heartbeat; stalls longer than the threshold are logged with the
+# main thread's stack
+UI_HEARTBEAT_MS = 50
+UI_STALL_THRESHOLD_MS = 200
 
 
 def main():
@@ -25,8 +37,27 @@ def main():
         root = tk.Tk()
         app = IMDbApp(root)
         app.movie_manager = movie_manager
+
+        watchdog = MainLoopWatchdog(root, interval_ms=UI_HEARTBEAT_MS, threshold_ms=UI_STALL_THRESHOLD_MS)
+        watchdog.start()
+        app.watchdog = watchdog
+
         app.populate_movie_list()
+
+        # Serve the cached data right away and revalidate it in the background;
+        # updated rows are pushed to the UI thread without rebuilding the list
+        scheduler = RefreshScheduler(
+            movie_manager,
+            interval=REFRESH_INTERVAL,
+            max_age=REFRESH_MAX_AGE,
+            request_budget=REFRESH_REQUEST_BUDGET,
+            on_updated=lambda ids: root.after(0, app.update_movie_rows, ids)
+        )
+        scheduler.start()
+
         root.mainloop()
+        scheduler.stop()
+        watchdog.stop()
     except Exception as e:
         messagebox.showerror("Application Error", f"An error occurred: {str(e)}")
         raise
@@ -0,0 +1,139 @@
+import sys
+from collections.abc import Mapping
+
+
+# Fields written to and read from movie_data.json, in display order
+MOVIE_FIELDS = (
+    "rank", "title", "imdb_id", "url", "year", "director", "rating", "genre",
+    "description", "storyline", "poster_url", "details_fetched", "storyline_fetched",
+    "fetched_at"
+)
+
+# Low-cardinality strings that repeat across many movies; interning them
+# makes every record share a single copy of each value
+_INTERNED_FIELDS = frozenset(("year", "director", "rating", "genre"))
+
+
+class Movie:
+    """
+    Compact record for a single movie.
+
+    Supports the dict-style access (get, [], update) the rest of the app
+    was written against, without the per-instance dict overhead.
+    """
+
+    __slots__ = (
+        "rank", "title", "imdb_id", "year", "director", "rating", "genre",
+        "description", "storyline", "poster_url", "details_fetched", "storyline_fetched",
+        "fetched_at"
+    )
+
+    def __init__(self, imdb_id, title, rank=None, **fields):
+        """
+        Initialize a movie record.
+
+        Args:
+            imdb_id (str): IMDb ID (e.g., 'tt0111161')
+            title (str): Movie title
+            rank (int): Current chart rank
+            **fields: Any other values from MOVIE_FIELDS
+        """
+        for name in self.__slots__:
+            object.__setattr__(self, name, None)
+        self.imdb_id = imdb_id
+        self.title = title
+        self.rank = rank
+        self.details_fetched = False
+        self.storyline_fetched = False
+        self.update(fields)
+
+    def __setattr__(self, name, value):
+        if name in _INTERNED_FIELDS and type(value) is str:
+            value = sys.intern(value)
+        object.__setattr__(self, name, value)
+
+    @property
+    def url(self):
+        """IMDb title page URL, derived from the ID instead of being stored."""
+        return f"https://www.imdb.com/title/{self.imdb_id}/" if self.imdb_id else None
+
+    def get(self, key, default=None):
+        """Return the value of a field, or default if it is unset."""
+        if key not in MOVIE_FIELDS:
+            return default
+        value = getattr(self, key)
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        if key not in MOVIE_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key == "url":
+            return
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in MOVIE_FIELDS and getattr(self, key) is not None
+
+    def update(self, fields):
+        """Update fields from a mapping, ignoring the derived url."""
+        for key, value in fields.items():
+            self[key] = value
+
+    def to_dict(self):
+        """Return a plain dict of the record, for JSON serialization."""
+        return {name: getattr(self, name) for name in MOVIE_FIELDS}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a record from a dict as saved by to_dict."""
+        fields = {k: v for k, v in data.items() if k in MOVIE_FIELDS}
+        if "storyline_fetched" not in fields:
+            # Files saved before storylines were lazy always fetched them
+            fields["storyline_fetched"] = fields.get("storyline") is not None
+        return cls(fields.pop("imdb_id"), fields.pop("title"), **fields)
+
+    def __repr__(self):
+        return f"Movie({self.imdb_id!r}, {self.title!r}, rank={self.rank!r})"
+
+
+class RankedView(Mapping):
+    """
+    Read-only mapping of rank -> Movie over a ranking list.
+
+    Returned instead of building a new dict on every call; it reads straight
+    from the manager's store.
+    """
+
+    __slots__ = ("_movies", "_ranking", "_limit")
+
+    def __init__(self, movies, ranking, limit=None):
+        """
+        Args:
+            movies (dict): Movie store indexed by IMDb ID
+            ranking (list): IMDb IDs in rank order
+            limit (int): Highest rank visible through the view (default: all)
+        """
+        self._movies = movies
+        self._ranking = ranking
+        self._limit = limit
+
+    def __len__(self):
+        if self._limit is None:
+            return len(self._ranking)
+        return min(self._limit, len(self._ranking))
+
+    def __getitem__(self, rank):
+        if not isinstance(rank, int) or not 1 <= rank <= len(self):
+            raise KeyError(rank)
+        return self._movies[self._ranking[rank - 1]]
+
+    def __iter__(self):
+        return iter(range(1, len(self) + 1))
+
+    def __repr__(self):
+        return f"RankedView({len(self)} movies)"
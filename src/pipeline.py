@@ -0,0 +1,141 @@
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+
+# Marks the end of a queue for the threads reading from it
+_DONE = object()
+
+
+def _process_context():
+    """
+    Return a start method that does not fork this process.
+
+    The pool starts after the download threads, and forking a process with
+    running threads can copy locks they hold (stdout, urllib3 pools, the
+    import lock) into a child that then deadlocks.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+class FetchParsePipeline:
+    """
+    Producer/consumer pipeline that downloads pages on threads and parses them
+    on a process pool.
+
+    Network threads only do I/O and hand raw page bytes to a bounded queue.
+    The caller's thread feeds that queue into the process pool, keeping at
+    most a fixed number of parses in flight. When parsing falls behind, the
+    page queue fills and the network threads block, so downloads never run
+    far ahead of what can be parsed.
+    """
+
+    def __init__(self, fetch_page, parse_page, network_workers=4, parse_workers=None, queue_size=16):
+        """
+        Args:
+            fetch_page (callable): fetch_page(url) -> bytes, run on network threads
+            parse_page (callable): Module-level parse_page(html, key) -> result,
+                run in worker processes
+            network_workers (int): Number of download threads
+            parse_workers (int): Number of parser processes (default: CPU count)
+            queue_size (int): Maximum downloaded pages waiting to be parsed
+        """
+        self.fetch_page = fetch_page
+        self.parse_page = parse_page
+        self.network_workers = network_workers
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+
+    def run(self, jobs):
+        """
+        Download and parse every job, yielding results as they complete.
+
+        Args:
+            jobs (iterable): (key, url) pairs
+
+        Yields:
+            tuple: (key, result, error) with error None on success
+        """
+        job_queue = queue.Queue(maxsize=self.queue_size)
+        page_queue = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+
+        def put(q, item):
+            # Give up instead of blocking forever once the consumer has stopped
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+
+        def feed_jobs():
+            for job in jobs:
+                if stop.is_set():
+                    return
+                put(job_queue, job)
+            for _ in range(self.network_workers):
+                put(job_queue, _DONE)
+
+        def download():
+            while not stop.is_set():
+                job = job_queue.get()
+                if job is _DONE:
+                    break
+                key, url = job
+                try:
+                    put(page_queue, (key, self.fetch_page(url), None))
+                except Exception as e:
+                    put(page_queue, (key, None, e))
+            put(page_queue, _DONE)
+
+        threads = [threading.Thread(target=feed_jobs, daemon=True)]
+        threads += [threading.Thread(target=download, daemon=True) for _ in range(self.network_workers)]
+        for thread in threads:
+            thread.start()
+
+        max_in_flight = self.parse_workers * 2
+        running_downloads = self.network_workers
+        in_flight = {}
+
+        try:
+            with ProcessPoolExecutor(max_workers=self.parse_workers, mp_context=_process_context()) as pool:
+                while running_downloads or in_flight:
+                    # Only take a new page while there is room in the pool, so
+                    # the bounded page queue is what pushes back on downloads
+                    while running_downloads and len(in_flight) < max_in_flight:
+                        block = not in_flight
+                        try:
+                            item = page_queue.get(block=block)
+                        except queue.Empty:
+                            break
+                        if item is _DONE:
+                            running_downloads -= 1
+                            continue
+                        key, page, error = item
+                        if error is not None:
+                            yield key, None, error
+                            continue
+                        in_flight[pool.submit(self.parse_page, page, key)] = key
+
+                    if not in_flight:
+                        continue
+
+                    done, _ = wait(in_flight, timeout=0.05, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        key = in_flight.pop(future)
+                        try:
+                            yield key, future.result(), None
+                        except Exception as e:
+                            yield key, None, e
+        finally:
+            stop.set()
+            # Wake any download thread still waiting for a job
+            for _ in range(self.network_workers):
+                try:
+                    job_queue.put_nowait(_DONE)
+                except queue.Full:
+                    break
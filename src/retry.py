@@ -0,0 +1,211 @@
+import random
+import threading
+import time
+from collections import Counter
+from email.utils import parsedate_to_datetime
+
+import requests
+
+
+# Statuses worth retrying; 429 and 503 also mean the server wants us to slow down
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+THROTTLE_STATUSES = {429, 503}
+
+
+def backoff_delay(attempt, base_delay=1.0, max_delay=30.0):
+    """
+    Exponential backoff with full jitter.
+
+    Args:
+        attempt (int): Zero-based retry attempt
+        base_delay (float): Delay ceiling for the first retry, in seconds
+        max_delay (float): Upper bound for the delay ceiling, in seconds
+
+    Returns:
+        float: Seconds to wait before the next attempt
+    """
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value (str): Either a number of seconds or an HTTP date
+
+    Returns:
+        float: Seconds to wait, or None if the value is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """
+    Pauses every caller once the server starts throttling.
+
+    A throttled response opens the breaker for a cooldown that doubles each
+    time it reopens without a success in between; while open, wait() blocks
+    all workers instead of letting each one burn its own retries against the
+    server. Throttles from requests already in flight when it opened only
+    extend the pause to honor their Retry-After.
+    """
+
+    def __init__(self, cooldown=5.0, max_cooldown=120.0):
+        """
+        Args:
+            cooldown (float): Pause after the first throttled response, in seconds
+            max_cooldown (float): Longest pause, in seconds
+        """
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.trips = 0
+        self._consecutive = 0
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        """Whether callers are currently being paused."""
+        return time.monotonic() < self._open_until
+
+    def wait(self):
+        """Block until the breaker is closed."""
+        while True:
+            with self._lock:
+                remaining = self._open_until - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(remaining)
+
+    def record_throttle(self, retry_after=None):
+        """
+        Open the breaker after a throttled response.
+
+        Args:
+            retry_after (float): Server-requested delay in seconds, if any
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now >= self._open_until:
+                pause = min(self.max_cooldown, self.cooldown * (2 ** self._consecutive))
+                self._consecutive += 1
+                self.trips += 1
+            elif retry_after is not None and now + retry_after > self._open_until:
+                pause = 0.0
+            else:
+                # Part of the wave of throttles that already opened the breaker
+                return
+            if retry_after is not None:
+                pause = max(pause, retry_after)
+            self._open_until = max(self._open_until, now + pause)
+            remaining = self._open_until - now
+        print(f"IMDb is throttling requests, pausing all fetches for {remaining:.1f} seconds")
+
+    def record_success(self):
+        """Reset the cooldown growth after a successful response."""
+        with self._lock:
+            self._consecutive = 0
+
+
+class RequestStats:
+    """
+    Request and retry counters shared by every fetching thread.
+
+    Totals are updated under a lock. Each thread also keeps its own counts,
+    so a background job can measure what it spent without counting requests
+    made by the UI at the same time.
+    """
+
+    def __init__(self):
+        """Initialize with every counter at zero."""
+        self._counts = Counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def increment(self, key, n=1):
+        """
+        Add n to a counter, both in total and for the calling thread.
+
+        Args:
+            key (str): Counter name, e.g. "requests"
+            n (int): Amount to add
+        """
+        with self._lock:
+            self._counts[key] += n
+        counts = self._local.__dict__.setdefault("counts", Counter())
+        counts[key] += n
+
+    def __getitem__(self, key):
+        with self._lock:
+            return self._counts[key]
+
+    def thread_count(self, key):
+        """Return a counter's value for the calling thread only."""
+        return self._local.__dict__.get("counts", Counter())[key]
+
+
+def get_with_retry(url, headers, stage, breaker=None, max_retries=3, base_delay=1.0,
+                   max_delay=30.0, timeout=15, stats=None):
+    """
+    GET a URL, retrying only this request on transient failures.
+
+    Args:
+        url (str): URL to fetch
+        headers (dict): Request headers
+        stage (str): Name of the fetch stage, used in log messages
+        breaker (CircuitBreaker): Shared breaker to wait on and report throttling to
+        max_retries (int): Maximum number of attempts
+        base_delay (float): Backoff delay ceiling for the first retry, in seconds
+        max_delay (float): Upper bound for the backoff delay, in seconds
+        timeout (float): Per-request timeout, in seconds
+        stats (RequestStats): Optional counter of requests and retries
+
+    Returns:
+        requests.Response: The successful response
+    """
+    for attempt in range(max_retries):
+        if breaker:
+            breaker.wait()
+
+        retry_after = None
+        try:
+            if stats is not None:
+                stats.increment("requests")
+            response = requests.get(url, headers=headers, timeout=timeout)
+
+            if response.status_code in THROTTLE_STATUSES:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if breaker:
+                    breaker.record_throttle(retry_after)
+            if response.status_code not in RETRYABLE_STATUSES:
+                # Anything else is either success or an error a retry won't fix
+                response.raise_for_status()
+                if breaker:
+                    breaker.record_success()
+                return response
+
+            error = requests.HTTPError(f"{response.status_code} Error for url: {url}", response=response)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            error = e
+
+        if attempt == max_retries - 1:
+            print(f"{stage} failed after {max_retries} attempts: {error}")
+            raise error
+
+        delay = backoff_delay(attempt, base_delay, max_delay)
+        if retry_after is not None and not breaker:
+            delay = max(delay, retry_after)
+        if stats is not None:
+            stats.increment("retries")
+        print(f"{stage} attempt {attempt + 1}/{max_retries} failed: {error}. Retrying in {delay:.1f} seconds...")
+        time.sleep(delay)
@@ -0,0 +1,106 @@
+import threading
+import time
+
+
+class RefreshScheduler:
+    """
+    Revalidates cached movies in the background (stale-while-revalidate).
+
+    The app keeps serving whatever MovieManager already holds. Every interval
+    a daemon thread refetches the title pages of the movies whose details are
+    oldest, stopping once it has spent its request budget, and reports the
+    movies that changed through on_updated.
+    """
+
+    def __init__(self, movie_manager, interval=3600, max_age=24 * 3600, request_budget=20,
+                 initial_delay=10, on_updated=None, filename="movie_data.json"):
+        """
+        Args:
+            movie_manager (MovieManager): Manager whose movies are revalidated
+            interval (float): Seconds between revalidation passes
+            max_age (float): Details younger than this are left alone, in seconds
+            request_budget (int): Maximum HTTP requests per pass, retries included
+            initial_delay (float): Seconds before the first pass
+            on_updated (callable): Called from the scheduler thread with the
+                list of IMDb IDs whose details changed
+            filename (str): File to save the movie data to after a pass
+                that changed something (None to skip saving)
+        """
+        self.movie_manager = movie_manager
+        self.interval = interval
+        self.max_age = max_age
+        self.request_budget = request_budget
+        self.initial_delay = initial_delay
+        self.on_updated = on_updated
+        self.filename = filename
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start the background thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Ask the background thread to stop after the current movie."""
+        self._stop.set()
+
+    def _run(self):
+        delay = self.initial_delay
+        while not self._stop.wait(delay):
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"Background refresh failed: {e}")
+            delay = self.interval
+
+    def stale_movies(self):
+        """
+        Return the movies due for revalidation, oldest first.
+
+        Returns:
+            list: IMDb IDs whose details are missing or older than max_age
+        """
+        now = time.time()
+        due = []
+        for imdb_id, movie in list(self.movie_manager.movies.items()):
+            fetched_at = movie.get("fetched_at", 0)
+            if not movie.get("details_fetched", False) or now - fetched_at > self.max_age:
+                due.append((fetched_at, imdb_id))
+        due.sort()
+        return [imdb_id for _, imdb_id in due]
+
+    def run_once(self):
+        """
+        Revalidate the oldest stale movies within the request budget.
+
+        Returns:
+            list: IMDb IDs whose details changed
+        """
+        # Only this thread's requests count against the budget, so fetches the
+        # user triggers meanwhile do not use it up
+        stats = self.movie_manager.request_stats
+        start_requests = stats.thread_count("requests")
+        updated = []
+
+        for imdb_id in self.stale_movies():
+            if self._stop.is_set() or stats.thread_count("requests") - start_requests >= self.request_budget:
+                break
+            try:
+                if self.movie_manager.revalidate_movie(imdb_id):
+                    updated.append(imdb_id)
+            except Exception as e:
+                print(f"Error revalidating {imdb_id}: {e}")
+
+        spent = stats.thread_count("requests") - start_requests
+        print(f"Background refresh: {len(updated)} movies updated using {spent} requests")
+
+        if updated:
+            if self.filename:
+                self.movie_manager.save_to_file(self.filename)
+            if self.on_updated:
+                self.on_updated(updated)
+        return updated
@@ -0,0 +1,212 @@
+import bisect
+import json
+import os
+import re
+import threading
+
+
+# How much a match in each field counts towards a movie's score
+FIELD_WEIGHTS = {
+    "title": 5.0,
+    "director": 3.0,
+    "genre": 2.0,
+    "description": 1.0,
+    "storyline": 0.5,
+}
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """
+    Split text into lowercase search terms.
+
+    Args:
+        text (str): Text to tokenize
+
+    Returns:
+        list: Terms of two or more characters
+    """
+    if not text or text == "N/A":
+        return []
+    return [t for t in _TOKEN_RE.findall(text.casefold()) if len(t) > 1]
+
+
+class SearchIndex:
+    """
+    Inverted index over movie text fields, updated one movie at a time.
+
+    Safe to share between threads: worker threads index movies as their
+    details arrive while the Tk thread searches.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        # term -> {imdb_id: score}
+        self.postings = {}
+        # imdb_id -> terms indexed for it, so a movie can be re-indexed
+        self.doc_terms = {}
+        self._sorted_terms = []
+        self._terms_dirty = False
+        # Reentrant because add() re-indexes through remove()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self.doc_terms)
+
+    def __contains__(self, imdb_id):
+        with self._lock:
+            return imdb_id in self.doc_terms
+
+    def add(self, movie):
+        """
+        Index (or re-index) a movie.
+
+        Args:
+            movie (Movie): Movie record with at least imdb_id and title
+        """
+        imdb_id = movie.get("imdb_id")
+
+        scores = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            terms = tokenize(movie.get(field))
+            if not terms:
+                continue
+            # Long fields should not outscore a short exact title match just by
+            # repeating a word, so each term counts once per field
+            for term in set(terms):
+                scores[term] = scores.get(term, 0.0) + weight
+
+        with self._lock:
+            self.remove(imdb_id)
+            for term, score in scores.items():
+                if term not in self.postings:
+                    self.postings[term] = {}
+                    self._terms_dirty = True
+                self.postings[term][imdb_id] = score
+            self.doc_terms[imdb_id] = list(scores)
+
+    def remove(self, imdb_id):
+        """Remove a movie from the index if present."""
+        with self._lock:
+            for term in self.doc_terms.pop(imdb_id, ()):
+                docs = self.postings.get(term)
+                if docs is None:
+                    continue
+                docs.pop(imdb_id, None)
+                if not docs:
+                    del self.postings[term]
+                    self._terms_dirty = True
+
+    def _terms_with_prefix(self, prefix):
+        """Return every indexed term starting with prefix. Call with the lock held."""
+        if self._terms_dirty:
+            self._sorted_terms = sorted(self.postings)
+            self._terms_dirty = False
+        start = bisect.bisect_left(self._sorted_terms, prefix)
+        end = bisect.bisect_left(self._sorted_terms, prefix + "\uffff")
+        return self._sorted_terms[start:end]
+
+    def search(self, query, limit=20):
+        """
+        Search the index.
+
+        Every query term must match. The last term also matches as a prefix,
+        so results update sensibly while the user is still typing.
+
+        Args:
+            query (str): Free-text query
+            limit (int): Maximum number of results
+
+        Returns:
+            list: IMDb IDs ordered by descending score
+        """
+        words = _TOKEN_RE.findall(query.casefold())
+        if not words:
+            return []
+        # Match the indexing rule so one-letter words like "a" never have to
+        # match exactly; only the last word may be that short, as a prefix
+        terms = [w for w in words[:-1] if len(w) > 1] + words[-1:]
+
+        totals = None
+        with self._lock:
+            for i, term in enumerate(terms):
+                matches = {}
+                candidates = self._terms_with_prefix(term) if i == len(terms) - 1 else [term]
+                for candidate in candidates:
+                    # Exact matches rank above prefix completions
+                    factor = 1.0 if candidate == term else 0.5
+                    for imdb_id, score in self.postings.get(candidate, {}).items():
+                        matches[imdb_id] = max(matches.get(imdb_id, 0.0), score * factor)
+
+                if totals is None:
+                    totals = matches
+                else:
+                    totals = {k: v + matches[k] for k, v in totals.items() if k in matches}
+                if not totals:
+                    return []
+
+        ranked = sorted(totals.items(), key=lambda item: (-item[1], item[0]))
+        return [imdb_id for imdb_id, _ in ranked[:limit]]
+
+    def save(self, filename):
+        """
+        Save the index to a JSON file.
+
+        Args:
+            filename (str): Path to save the index to
+
+        Returns:
+            bool: True if successful
+        """
+        try:
+            with self._lock:
+                data = json.dumps(self.postings, ensure_ascii=False)
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write(data)
+            return True
+        except Exception as e:
+            print(f"Error saving search index: {e}")
+            return False
+
+    def load(self, filename):
+        """
+        Load the index from a JSON file.
+
+        Args:
+            filename (str): Path to the index file
+
+        Returns:
+            bool: True if the index was loaded
+        """
+        try:
+            if not os.path.exists(filename):
+                return False
+
+            with open(filename, 'r', encoding='utf-8') as f:
+                postings = json.load(f)
+
+            doc_terms = {}
+            for term, docs in postings.items():
+                for imdb_id in docs:
+                    doc_terms.setdefault(imdb_id, []).append(term)
+
+            with self._lock:
+                self.postings = postings
+                self.doc_terms = doc_terms
+                self._terms_dirty = True
+            return True
+        except Exception as e:
+            print(f"Error loading search index: {e}")
+            with self._lock:
+                self.postings = {}
+                self.doc_terms = {}
+                self._terms_dirty = True
+            return False
+
+
+def index_filename_for(filename):
+    """Return the search index path stored next to a movie data file."""
+    root, _ = os.path.splitext(filename)
+    return f"{root}.index.json"
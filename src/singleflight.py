@@ -0,0 +1,129 @@
+import functools
+import threading
+
+
+class _Call:
+    """One in-flight call and the result its waiters will share."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Collapses concurrent identical calls into one.
+
+    While a call for a key is running, other threads calling do() with the
+    same key wait for it and get its result (or its exception) instead of
+    running the function again. Once it finishes, the next call for the key
+    runs fresh.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.shared = 0
+
+    def do(self, key, fn, *args, **kwargs):
+        """
+        Run fn(*args, **kwargs) unless a call for key is already running.
+
+        Args:
+            key: Hashable key identifying identical calls
+            fn (callable): Function to run
+
+        Returns:
+            The result of fn, possibly from another thread's call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def claim(self, key):
+        """
+        Mark key as in flight for work the caller runs outside do(), e.g. in a batch.
+
+        Other threads calling do() with the key wait until release() is called.
+
+        Args:
+            key: Hashable key identifying identical calls
+
+        Returns:
+            bool: True if claimed, False if a call for key is already running
+        """
+        with self._lock:
+            if key in self._calls:
+                return False
+            self._calls[key] = _Call()
+            self.executions += 1
+            return True
+
+    def release(self, key, result=None, error=None):
+        """
+        Finish a claimed key, handing its result (or error) to any waiters.
+
+        Args:
+            key: Key passed to claim()
+            result: Value returned to waiting callers
+            error (Exception): Raised in waiting callers instead, if set
+        """
+        with self._lock:
+            call = self._calls.pop(key)
+        call.result = result
+        call.error = error
+        call.done.set()
+
+    def stats(self):
+        """Return how many calls ran and how many duplicates were avoided."""
+        with self._lock:
+            return {
+                "executions": self.executions,
+                "duplicates_avoided": self.shared,
+                "in_flight": len(self._calls),
+            }
+
+
+def single_flight(group):
+    """
+    Decorator routing every call of a function through a SingleFlight.
+
+    Calls are identical when they have the same positional and keyword
+    arguments, which must be hashable.
+
+    Args:
+        group (SingleFlight): Group to share in-flight calls through
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+            return group.do(key, fn, *args, **kwargs)
+        return wrapper
+    return decorator
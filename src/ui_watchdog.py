@@ -0,0 +1,130 @@
+import math
+import sys
+import threading
+import tkinter as tk
+import time
+import traceback
+from collections import deque
+
+
+def percentile(values, pct):
+    """
+    Return the pct-th percentile of values (nearest rank).
+
+    Args:
+        values (list): Numbers to summarise
+        pct (float): Percentile between 0 and 100
+
+    Returns:
+        float: The percentile, or 0.0 for no values
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class MainLoopWatchdog:
+    """
+    Measures how long the Tk event loop goes without running callbacks.
+
+    A heartbeat is scheduled with root.after every interval_ms; how late each
+    beat runs is the event-loop latency. A monitor thread watches for beats
+    that are overdue by more than threshold_ms and, while the stall is still
+    happening, captures the main thread's stack so the log shows what was
+    blocking the UI.
+    """
+
+    def __init__(self, root, interval_ms=50, threshold_ms=200, history=10000, log=print):
+        """
+        Args:
+            root (tk.Tk): Root window whose event loop is watched
+            interval_ms (int): Heartbeat interval in milliseconds
+            threshold_ms (int): Latency above which a stall is logged
+            history (int): Number of latency samples and stalls kept
+            log (callable): Function used to report stalls
+        """
+        self.root = root
+        self.interval_ms = interval_ms
+        self.threshold_ms = threshold_ms
+        self.log = log
+        self.latencies = deque(maxlen=history)
+        self.stalls = deque(maxlen=history)
+        self.stall_count = 0
+
+        self._main_thread_id = None
+        self._expected = None
+        self._after_id = None
+        self._stall_stack = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def start(self):
+        """Start the heartbeat and monitor thread. Call from the Tk thread."""
+        self._main_thread_id = threading.get_ident()
+        self._stop.clear()
+        self._schedule()
+        threading.Thread(target=self._monitor, daemon=True).start()
+
+    def stop(self):
+        """Stop the heartbeat and monitor thread."""
+        self._stop.set()
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                # The window is already gone, and its callbacks with it
+                pass
+            self._after_id = None
+
+    def _schedule(self):
+        with self._lock:
+            self._expected = time.perf_counter() + self.interval_ms / 1000
+        self._after_id = self.root.after(self.interval_ms, self._beat)
+
+    def _beat(self):
+        latency_ms = max(0.0, (time.perf_counter() - self._expected) * 1000)
+        self.latencies.append(latency_ms)
+
+        if latency_ms > self.threshold_ms:
+            with self._lock:
+                stack = self._stall_stack
+                self._stall_stack = None
+            self.stalls.append(latency_ms)
+            self.stall_count += 1
+            message = f"UI stall: event loop blocked for {latency_ms:.0f} ms"
+            if stack:
+                message += "\nMain thread stack during the stall:\n" + "".join(stack)
+            self.log(message)
+
+        if not self._stop.is_set():
+            self._schedule()
+
+    def _monitor(self):
+        """Capture the main thread's stack while a heartbeat is overdue."""
+        poll = self.interval_ms / 2000
+        while not self._stop.wait(poll):
+            with self._lock:
+                overdue_ms = (time.perf_counter() - self._expected) * 1000
+                if overdue_ms <= self.threshold_ms or self._stall_stack is not None:
+                    continue
+                frame = sys._current_frames().get(self._main_thread_id)
+                if frame is not None:
+                    self._stall_stack = traceback.format_stack(frame)
+
+    def stats(self):
+        """
+        Summarise event-loop latency.
+
+        Returns:
+            dict: p50/p99/max latency and stall count, in milliseconds
+        """
+        latencies = list(self.latencies)
+        return {
+            "samples": len(latencies),
+            "p50_ms": percentile(latencies, 50),
+            "p99_ms": percentile(latencies, 99),
+            "max_ms": max(latencies, default=0.0),
+            "stalls": self.stall_count,
+        }